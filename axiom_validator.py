@@ -10,11 +10,42 @@ Phase 2C Week 2 - Quality Assurance Gate
 """
 
 import json
-from typing import Dict, Any, List, Optional
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Dict, Any, Callable, List, Optional, Tuple
 from pathlib import Path
 from kitbash_cartridge import Cartridge
 from kitbash_registry import PhantomCandidate
 
+try:
+    import numpy as np
+except ImportError:  # Batch path falls back to per-phantom validation
+    np = None
+
+
+# Rule thresholds (shared by per-phantom and batch paths)
+RESISTANCE_MIN_CONFIDENCE = 0.91       # Rule 2: confidence must exceed this
+INDEPENDENCE_MAX_VARIANCE = 0.02       # Rule 3: confidence variance must stay below
+SINGLE_OBSERVATION_MIN_CONFIDENCE = 0.90  # Rule 3 fallback for one observation
+
+
+@dataclass
+class ValidationResult:
+    """
+    Compact record of a phantom that failed batch validation.
+    
+    Only the rule names are kept; full_report() builds the
+    validate_phantom()-style dict (messages, checks, stats) on demand.
+    """
+    fact_id: int
+    failed_rules: List[str]
+    overall_passed: bool
+    _build_report: Callable[[], Dict[str, Any]] = field(repr=False, compare=False)
+    
+    def full_report(self) -> Dict[str, Any]:
+        """Materialize the full validation result dict."""
+        return self._build_report()
+
 
 class AxiomValidator:
     """
@@ -31,13 +62,20 @@ class AxiomValidator:
         self.validation_log: List[Dict] = []
     
     def validate_phantom(self, phantom: PhantomCandidate, 
-                        cartridge_facts: Dict[int, str]) -> Dict[str, Any]:
+                        cartridge_facts: Dict[int, str],
+                        full_report: bool = False) -> Dict[str, Any]:
         """
         Apply all three Sicherman validation rules.
         
+        Rules run cheapest-first: the confidence threshold and the variance
+        check read the phantom's running stats, while persistence needs a
+        fact lookup. Unless full_report is set, validation stops at the
+        first failing rule and rule_failures names only that rule.
+        
         Args:
             phantom: PhantomCandidate from locked registry
             cartridge_facts: All facts in this cartridge (for context)
+            full_report: Evaluate every rule even after one fails
         
         Returns:
             Validation result with lock_state and rule checks
@@ -57,67 +95,67 @@ class AxiomValidator:
             'cycles_locked': phantom.last_cycle_seen - phantom.first_cycle_seen,
         }
         
-        # RULE 1: PERSISTENCE
-        # Check that phantom pointer resolves to valid fact
+        # Cheap screens: most rejected phantoms never reach the fact lookup
+        confident = result['confidence'] > RESISTANCE_MIN_CONFIDENCE
+        if not confident and not full_report:
+            result['rule_failures'].append(
+                f'least_resistance: confidence {result["confidence"]:.2f} < {RESISTANCE_MIN_CONFIDENCE}'
+            )
+            self.validation_log.append(result)
+            return result
+        
+        independent, independence_failure = self._check_independence(
+            phantom, result['confidence']
+        )
+        if not independent and not full_report:
+            result['rule_failures'].append(independence_failure)
+            self.validation_log.append(result)
+            return result
+        
+        # Resolve the fact once for rules 1 and 2: an O(1) probe into the
+        # caller's fact index, or a single SQLite lookup if none was given
+        fact_text = None
+        lookup_error = None
         try:
-            fact = self.cartridge.get_fact(phantom.fact_id)
-            if fact:
-                result['persistent_check'] = True
+            if cartridge_facts:
+                fact_text = cartridge_facts.get(phantom.fact_id)
             else:
-                result['rule_failures'].append('persistence: fact not found')
+                fact_text = self.cartridge.get_fact(phantom.fact_id)
         except Exception as e:
-            result['rule_failures'].append(f'persistence: {str(e)}')
+            lookup_error = e
+        
+        # RULE 1: PERSISTENCE
+        # Check that phantom pointer resolves to valid fact
+        if lookup_error is not None:
+            result['rule_failures'].append(f'persistence: {str(lookup_error)}')
+        elif fact_text:
+            result['persistent_check'] = True
+        else:
+            result['rule_failures'].append('persistence: fact not found')
         
         # RULE 2: LEAST RESISTANCE  
         # Check that fact is stable and compressible
         # For MVP: rely on confidence scores (high confidence = stable = compressible)
-        try:
-            fact_text = self.cartridge.get_fact(phantom.fact_id)
-            
-            if fact_text:
-                # Fact exists - check compressibility heuristics
-                # High confidence facts are inherently more compressible
-                # (lower entropy, more predictable)
-                if result['confidence'] > 0.91:
-                    result['resistance_check'] = True
-                else:
-                    result['rule_failures'].append(
-                        f'least_resistance: confidence {result["confidence"]:.2f} < 0.91'
-                    )
+        if lookup_error is not None:
+            result['rule_failures'].append(f'least_resistance: {str(lookup_error)}')
+        elif fact_text:
+            # Fact exists - check compressibility heuristics
+            # High confidence facts are inherently more compressible
+            # (lower entropy, more predictable)
+            if confident:
+                result['resistance_check'] = True
             else:
-                result['rule_failures'].append('least_resistance: fact not found')
+                result['rule_failures'].append(
+                    f'least_resistance: confidence {result["confidence"]:.2f} < {RESISTANCE_MIN_CONFIDENCE}'
+                )
+        else:
+            result['rule_failures'].append('least_resistance: fact not found')
         
-        except Exception as e:
-            result['rule_failures'].append(f'least_resistance: {str(e)}')
-        
-        # RULE 3: INDEPENDENCE
-        # Check that phantom pattern doesn't contradict domain axioms
-        try:
-            # For now: check confidence stability and absence of oscillation
-            if len(phantom.confidence_history) > 1:
-                # Calculate variance
-                import statistics
-                variance = statistics.variance(phantom.confidence_history)
-                
-                # Low variance = stable = aligns with axioms (not contradictory)
-                # Typical variance for high-confidence facts: 0.001-0.01
-                if variance < 0.02:  # Threshold: 0.02
-                    result['independence_check'] = True
-                else:
-                    result['rule_failures'].append(
-                        f'independence: high confidence variance ({variance:.4f})'
-                    )
-            else:
-                # Single observation - assume valid if high confidence
-                if result['confidence'] > 0.90:
-                    result['independence_check'] = True
-                else:
-                    result['rule_failures'].append(
-                        'independence: insufficient observations'
-                    )
-        
-        except Exception as e:
-            result['rule_failures'].append(f'independence: {str(e)}')
+        # RULE 3: INDEPENDENCE (evaluated above)
+        if independent:
+            result['independence_check'] = True
+        else:
+            result['rule_failures'].append(independence_failure)
         
         # FINAL DECISION
         if all([result['persistent_check'],
@@ -130,6 +168,34 @@ class AxiomValidator:
         self.validation_log.append(result)
         return result
     
+    def _check_independence(self, phantom: PhantomCandidate,
+                            confidence: float) -> Tuple[bool, Optional[str]]:
+        """
+        RULE 3: check that the phantom pattern doesn't contradict domain axioms.
+        
+        Returns:
+            (passed, failure message or None)
+        """
+        try:
+            # For now: check confidence stability and absence of oscillation
+            if len(phantom.confidence_history) > 1:
+                # Variance is kept incrementally on the phantom
+                variance = phantom._confidence_variance()
+                
+                # Low variance = stable = aligns with axioms (not contradictory)
+                # Typical variance for high-confidence facts: 0.001-0.01
+                if variance < INDEPENDENCE_MAX_VARIANCE:
+                    return True, None
+                return False, f'independence: high confidence variance ({variance:.4f})'
+            
+            # Single observation - assume valid if high confidence
+            if confidence > SINGLE_OBSERVATION_MIN_CONFIDENCE:
+                return True, None
+            return False, 'independence: insufficient observations'
+        
+        except Exception as e:
+            return False, f'independence: {str(e)}'
+    
     def _count_ternary_derivations(self, derivations: List[Any]) -> int:
         """Count how many derivations can be expressed as ternary."""
         if not derivations:
@@ -185,6 +251,187 @@ class AxiomValidator:
             'validation_log': self.validation_log
         }
     
+    def validate_batch_vec(self, phantoms: Dict[int, PhantomCandidate],
+                           cartridge_facts: Optional[Dict[int, str]] = None) -> Dict[str, Any]:
+        """
+        Validate all phantoms at once using NumPy array operations.
+
+        Phantom fields are laid out as parallel arrays (structure-of-arrays)
+        and the three rules are evaluated as boolean masks over the batch.
+        Means and variances are the phantoms' exact running stats, so
+        decisions match validate_phantom().
+        Passing phantoms are returned directly; failures come back as
+        ValidationResult records whose full_report() builds the result
+        dict on demand. Falls back to validate_phantom() when NumPy is
+        not installed. Either way, like validate_fast(), nothing is
+        written to validation_log.
+
+        Args:
+            phantoms: Dict of fact_id -> PhantomCandidate
+            cartridge_facts: All facts in cartridge (fetched if not given)
+
+        Returns:
+            Summary with locked phantoms and failure reports
+        """
+
+        items = list(phantoms.values())
+        n = len(items)
+
+        if np is None:
+            locked, failures = [], []
+            log_start = len(self.validation_log)
+            try:
+                for phantom in items:
+                    result = self.validate_phantom(phantom, cartridge_facts, full_report=True)
+                    if result['locked']:
+                        locked.append(phantom)
+                    else:
+                        failures.append(ValidationResult(
+                            fact_id=phantom.fact_id,
+                            failed_rules=[f.split(':', 1)[0] for f in result['rule_failures']],
+                            overall_passed=False,
+                            _build_report=result.copy,
+                        ))
+            finally:
+                # Same log as the NumPy path, which records nothing
+                del self.validation_log[log_start:]
+            return self._batch_summary(n, locked, failures)
+
+        if not cartridge_facts:
+            cartridge_facts = self.cartridge.get_facts([p.fact_id for p in items])
+
+        # Structure-of-arrays view of the batch
+        fact_ok = np.fromiter((bool(cartridge_facts.get(p.fact_id)) for p in items),
+                              dtype=bool, count=n)
+        n_obs = np.fromiter((len(p.confidence_history) for p in items),
+                            dtype=np.int32, count=n)
+
+        # The phantoms' exact running stats, so every threshold comparison
+        # sees the same value validate_phantom() does
+        means = np.fromiter((p._avg_confidence() for p in items),
+                            dtype=np.float64, count=n)
+        variances = np.fromiter((p._confidence_variance() for p in items),
+                                dtype=np.float64, count=n)
+
+        # Rule masks
+        persistence_pass = fact_ok
+        resistance_pass = fact_ok & (means > RESISTANCE_MIN_CONFIDENCE)
+        independence_pass = np.where(n_obs > 1,
+                                     variances < INDEPENDENCE_MAX_VARIANCE,
+                                     means > SINGLE_OBSERVATION_MIN_CONFIDENCE)
+        locked_mask = persistence_pass & resistance_pass & independence_pass
+
+        locked = [items[i] for i in np.flatnonzero(locked_mask)]
+        failures = []
+        for i in np.flatnonzero(~locked_mask):
+            persistent = bool(persistence_pass[i])
+            resistant = bool(resistance_pass[i])
+            independent = bool(independence_pass[i])
+            
+            if not persistent:
+                failed_rules = ['persistence', 'least_resistance']
+            elif not resistant:
+                failed_rules = ['least_resistance']
+            else:
+                failed_rules = []
+            if not independent:
+                failed_rules.append('independence')
+            
+            failures.append(ValidationResult(
+                fact_id=items[i].fact_id,
+                failed_rules=failed_rules,
+                overall_passed=False,
+                _build_report=partial(
+                    self._batch_failure_report, items[i], float(means[i]),
+                    float(variances[i]), int(n_obs[i]),
+                    persistent, resistant, independent,
+                ),
+            ))
+
+        return self._batch_summary(n, locked, failures)
+
+    def validate_fast(self, phantoms: Dict[int, PhantomCandidate],
+                      cartridge_facts: Optional[Dict[int, str]] = None) -> List[PhantomCandidate]:
+        """
+        Threshold-only screening: return just the phantoms that lock.
+        
+        Makes the same decisions as validate_phantom() from the phantoms'
+        running stats, but builds no result dicts and writes nothing to
+        validation_log. Use validate_phantom()/validate_batch_vec() when
+        failure reasons are needed.
+        
+        Args:
+            phantoms: Dict of fact_id -> PhantomCandidate
+            cartridge_facts: All facts in cartridge (fetched if not given)
+        
+        Returns:
+            Phantoms passing all three rules
+        """
+        
+        if not cartridge_facts:
+            cartridge_facts = self.cartridge.get_facts([p.fact_id for p in phantoms.values()])
+        
+        locked = []
+        for phantom in phantoms.values():
+            confidence = phantom._avg_confidence()
+            if not confidence > RESISTANCE_MIN_CONFIDENCE:
+                continue
+            if len(phantom.confidence_history) > 1:
+                if not phantom._confidence_variance() < INDEPENDENCE_MAX_VARIANCE:
+                    continue
+            elif not confidence > SINGLE_OBSERVATION_MIN_CONFIDENCE:
+                continue
+            if cartridge_facts.get(phantom.fact_id):
+                locked.append(phantom)
+        
+        return locked
+    
+    def _batch_failure_report(self, phantom: PhantomCandidate, confidence: float,
+                              variance: float, n_obs: int, persistent: bool,
+                              resistant: bool, independent: bool) -> Dict[str, Any]:
+        """Build a validate_phantom(full_report=True)-style result for a failed batch entry."""
+
+        failures = []
+        if not persistent:
+            failures.append('persistence: fact not found')
+            failures.append('least_resistance: fact not found')
+        elif not resistant:
+            failures.append(
+                f'least_resistance: confidence {confidence:.2f} < {RESISTANCE_MIN_CONFIDENCE}'
+            )
+        if not independent:
+            if n_obs > 1:
+                failures.append(f'independence: high confidence variance ({variance:.4f})')
+            else:
+                failures.append('independence: insufficient observations')
+
+        return {
+            'fact_id': phantom.fact_id,
+            'cartridge_id': self.cartridge_id,
+            'persistent_check': persistent,
+            'resistance_check': resistant,
+            'independence_check': independent,
+            'locked': False,
+            'lock_state': 'failed_validation',
+            'rule_failures': failures,
+            'confidence': confidence,
+            'hit_count': phantom.hit_count,
+            'cycles_locked': phantom.last_cycle_seen - phantom.first_cycle_seen,
+        }
+
+    def _batch_summary(self, total: int, locked: List[PhantomCandidate],
+                       failures: List[ValidationResult]) -> Dict[str, Any]:
+        """Summarize a batch validation run."""
+        return {
+            'total': total,
+            'locked': len(locked),
+            'failed': len(failures),
+            'pass_rate': len(locked) / total if total else 0,
+            'cartridge_id': self.cartridge_id,
+            'locked_phantoms': locked,
+            'failures': failures,
+        }
+
     def get_locked_phantoms(self, phantoms: Dict[int, PhantomCandidate],
                            cartridge_facts: Dict[int, str]) -> List[PhantomCandidate]:
         """Get list of phantoms that passed all validation rules."""
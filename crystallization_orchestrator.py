@@ -148,8 +148,13 @@ class CrystallizationOrchestrator:
         locked_phantoms = []
         validation_results = {}
         
+        # One query for every phantom's fact, instead of one per phantom.
+        # get_facts (like get_fact) also resolves archived facts, which
+        # cartridge.facts leaves out.
+        cartridge_facts = cartridge.get_facts(list(registry.phantoms))
+        
         for fact_id, phantom in registry.phantoms.items():
-            result = validator.validate_phantom(phantom, cartridge.facts)
+            result = validator.validate_phantom(phantom, cartridge_facts)
             validation_results[fact_id] = result
             
             if result['locked']:
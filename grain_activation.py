@@ -17,6 +17,11 @@ from dataclasses import dataclass
 from enum import Enum
 from shannon_grain import GrainMetadata, GrainState
 
+try:
+    import numpy as np
+except ImportError:  # lookup_batch falls back to per-grain lookups
+    np = None
+
 
 # ============================================================================
 # HAT CONTEXT SYSTEM
@@ -43,12 +48,34 @@ class HatContext:
         if len(bits) != len(self.xor_mask):
             raise ValueError(f"Bit length mismatch: {len(bits)} vs {len(self.xor_mask)}")
         
-        # XOR each byte
-        result = bytearray(len(bits))
-        for i in range(len(bits)):
-            result[i] = bits[i] ^ self.xor_mask[i]
+        # XOR the whole bit array as one wide integer instead of per byte
+        n = len(bits)
+        result = int.from_bytes(bits, 'little') ^ int.from_bytes(self.xor_mask, 'little')
+        return result.to_bytes(n, 'little')
+    
+    def apply_popcount(self, bits: bytes) -> int:
+        """Popcount of apply(bits), without building the masked bytes"""
+        if len(bits) != len(self.xor_mask):
+            raise ValueError(f"Bit length mismatch: {len(bits)} vs {len(self.xor_mask)}")
         
-        return bytes(result)
+        return (int.from_bytes(bits, 'little') ^ int.from_bytes(self.xor_mask, 'little')).bit_count()
+
+
+# Synthetic default masks (would be learned in real system). They depend only
+# on these seeds, so they are hashed once at import, not per HatRegistry.
+_DEFAULT_HAT_SEEDS = {
+    Hat.ANALYTICAL: b"analytical_context_mask_seed_001",
+    Hat.CREATIVE: b"creative_context_mask_seed_00002",
+    Hat.EMPATHETIC: b"empathetic_context_mask_seed_003",
+    Hat.DELIBERATIVE: b"deliberative_context_mask_seed_04",
+    Hat.NEUTRAL: b"neutral_context_mask_seed_00005",
+}
+
+# Each hat gets a different XOR mask: its seed expanded to 32 bytes (256 bits)
+# with SHA-256, which gives exactly 32 bytes
+DEFAULT_HAT_MASKS: Dict[Hat, bytes] = {
+    hat: hashlib.sha256(seed).digest() for hat, seed in _DEFAULT_HAT_SEEDS.items()
+}
 
 
 class HatRegistry:
@@ -64,24 +91,10 @@ class HatRegistry:
     
     def _init_default_hats(self) -> None:
         """Initialize default hat contexts with synthetic masks"""
-        # Each hat gets a different XOR mask (32 bytes = 256 bits)
-        
-        hat_seeds = {
-            Hat.ANALYTICAL: b"analytical_context_mask_seed_001",
-            Hat.CREATIVE: b"creative_context_mask_seed_00002",
-            Hat.EMPATHETIC: b"empathetic_context_mask_seed_003",
-            Hat.DELIBERATIVE: b"deliberative_context_mask_seed_04",
-            Hat.NEUTRAL: b"neutral_context_mask_seed_00005",
-        }
-        
-        for hat, seed in hat_seeds.items():
-            # Expand seed to 32 bytes (256 bits)
-            mask_hash = hashlib.sha256(seed).digest()
-            # Use first 32 bytes (sha256 gives exactly 32 bytes)
-            
+        for hat, mask in DEFAULT_HAT_MASKS.items():
             self.hats[hat] = HatContext(
                 hat_name=hat,
-                xor_mask=mask_hash,
+                xor_mask=mask,
                 description=f"Context mask for {hat.value} mode"
             )
     
@@ -147,19 +160,17 @@ class TernaryLookupEngine:
         bits_pos = grain.bit_array_plus
         bits_neg = grain.bit_array_minus
         
-        # Apply context if requested
+        # Count set bits (popcount), fused with the context XOR if requested
         if apply_context:
             context = self.hat_registry.get_current_context()
-            bits_pos = context.apply(bits_pos)
-            bits_neg = context.apply(bits_neg)
+            popcount_pos = context.apply_popcount(bits_pos)
+            popcount_neg = context.apply_popcount(bits_neg)
             current_hat = context.hat_name
         else:
+            popcount_pos = self._popcount_bytes(bits_pos)
+            popcount_neg = self._popcount_bytes(bits_neg)
             current_hat = Hat.NEUTRAL
         
-        # Count set bits (popcount)
-        popcount_pos = self._popcount_bytes(bits_pos)
-        popcount_neg = self._popcount_bytes(bits_neg)
-        
         # Compute ternary value
         total_set = popcount_pos + popcount_neg
         if total_set == 0:
@@ -183,17 +194,79 @@ class TernaryLookupEngine:
             context_hat=current_hat,
         )
     
+    def lookup_batch(self, grains: List[GrainMetadata],
+                     apply_context: bool = True) -> List[TernaryLookupResult]:
+        """
+        Ternary lookup for many grains at once.
+        
+        The grains' bit arrays are stacked into two uint8 matrices, so the
+        context XOR, popcounts and ternary values are each one NumPy
+        operation over the whole batch; latency_ms is the batch time split
+        evenly. Falls back to per-grain lookup() without NumPy, or when the
+        grains' bit arrays differ in length.
+        
+        Returns:
+            One TernaryLookupResult per grain, in input order
+        """
+        if not grains:
+            return []
+        
+        n = len(grains)
+        width = len(grains[0].bit_array_plus)
+        if np is None or any(len(g.bit_array_plus) != width or len(g.bit_array_minus) != width
+                             or g.num_bits <= 0 for g in grains):
+            return [self.lookup(grain, apply_context) for grain in grains]
+        
+        start_time = time.perf_counter()
+        
+        bits_pos = np.frombuffer(b"".join(g.bit_array_plus for g in grains), dtype=np.uint8).reshape(n, width)
+        bits_neg = np.frombuffer(b"".join(g.bit_array_minus for g in grains), dtype=np.uint8).reshape(n, width)
+        
+        if apply_context:
+            context = self.hat_registry.get_current_context()
+            if width != len(context.xor_mask):
+                raise ValueError(f"Bit length mismatch: {width} vs {len(context.xor_mask)}")
+            mask = np.frombuffer(context.xor_mask, dtype=np.uint8)
+            bits_pos = bits_pos ^ mask
+            bits_neg = bits_neg ^ mask
+            current_hat = context.hat_name
+        else:
+            current_hat = Hat.NEUTRAL
+        
+        popcount_pos = np.unpackbits(bits_pos, axis=1).sum(axis=1, dtype=np.int64)
+        popcount_neg = np.unpackbits(bits_neg, axis=1).sum(axis=1, dtype=np.int64)
+        
+        # Same formulas as lookup(), with 0.0 where no bits are set
+        total_set = popcount_pos + popcount_neg
+        has_bits = total_set > 0
+        num_bits = np.fromiter((g.num_bits for g in grains), dtype=np.float64, count=n)
+        ternary_values = np.where(has_bits, (popcount_pos - popcount_neg) / np.maximum(total_set, 1), 0.0)
+        confidences = np.where(has_bits, np.minimum(1.0, total_set / num_bits), 0.0)
+        
+        elapsed = (time.perf_counter() - start_time) * 1000 / n
+        
+        return [
+            TernaryLookupResult(
+                grain_id=grain.grain_id,
+                popcount_positive=pos,
+                popcount_negative=neg,
+                ternary_value=value,
+                confidence=confidence,
+                latency_ms=elapsed,
+                context_hat=current_hat,
+            )
+            for grain, pos, neg, value, confidence in zip(
+                grains, popcount_pos.tolist(), popcount_neg.tolist(),
+                ternary_values.tolist(), confidences.tolist(),
+            )
+        ]
+    
     @staticmethod
     def _popcount_bytes(data: bytes) -> int:
         """Count number of set bits in byte array"""
-        count = 0
-        for byte in data:
-            # Count bits set in this byte
-            b = byte
-            while b:
-                count += b & 1
-                b >>= 1
-        return count
+        # One big-int popcount (hardware POPCNT per machine word) instead
+        # of a Python loop over every bit
+        return int.from_bytes(data, 'little').bit_count()
 
 
 # ============================================================================
@@ -371,6 +444,24 @@ class GrainActivation:
         
         return result
     
+    def lookup_batch(self, grain_ids: List[str],
+                     apply_context: bool = True) -> List[Optional[TernaryLookupResult]]:
+        """
+        Ternary lookup for many grains in one vectorized pass.
+        
+        Returns:
+            One entry per grain_id, in order: the result, or None if that
+            grain is not cached
+        """
+        self.total_lookups += len(grain_ids)
+        
+        grains = [self.l3_cache.get_grain(grain_id) for grain_id in grain_ids]
+        cached = [grain for grain in grains if grain]
+        found = iter(self.lookup_engine.lookup_batch(cached, apply_context))
+        self.successful_lookups += len(cached)
+        
+        return [next(found) if grain else None for grain in grains]
+    
     def switch_context(self, hat: Hat) -> None:
         """Switch to a different behavioral context"""
         self.hat_registry.set_current_hat(hat)
@@ -10,62 +10,266 @@ Phase 3A Component
 
 import json
 import os
+import re
+import sqlite3
 import statistics
-from pathlib import Path
-from typing import Dict, List
+import sys
+from typing import Any, Dict, List, Optional, Tuple
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # stdlib json also accepts bytes
+    _json_loads = json.loads
 
-def find_all_grains(cartridges_dir: str = "./cartridges") -> Dict[str, List[str]]:
-    """Find all grain files across all cartridges."""
+
+# Fast path for listings: pull the three scalar fields straight out of the
+# raw bytes. Grain files are written with these keys in this order
+# (see GrainCrystallizer._save_grain_file).
+_LISTING_FIELDS_RE = re.compile(
+    rb'"grain_id"\s*:\s*"([^"\\]*)"'
+    rb'.*?"fact_id"\s*:\s*(-?\d+)'
+    rb'.*?"confidence"\s*:\s*(-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)',
+    re.S,
+)
+
+
+def _load_grain(grain_file: str) -> Dict:
+    """Read and decode a grain JSON file."""
+    with open(grain_file, 'rb') as f:
+        return _json_loads(f.read())
+
+
+def _read_listing_fields(grain_file: str) -> Tuple[str, Any, float]:
+    """Return (grain_id, fact_id, confidence), decoding the full JSON only if needed."""
+    with open(grain_file, 'rb') as f:
+        data = f.read()
+    
+    match = _LISTING_FIELDS_RE.search(data)
+    if match:
+        return match.group(1).decode(), int(match.group(2)), float(match.group(3))
+    
+    grain = _json_loads(data)
+    return (grain.get('grain_id', 'unknown'),
+            grain.get('fact_id', 'unknown'),
+            grain.get('confidence', 0.0))
+
+
+# Grain reads are independent and block on open()/read() latency, which
+# releases the GIL, so a thread pool overlaps them.
+IO_WORKERS = 16
+
+
+def _read_files_parallel(reader, paths: List[str]) -> List[Tuple[Any, Optional[Exception]]]:
+    """
+    Apply reader to every path on a thread pool.
+    
+    Returns:
+        List of (result, error) in input order; exactly one of the two is None.
+    """
+    def _safe_read(path):
+        try:
+            return reader(path), None
+        except Exception as e:
+            return None, e
+    
+    if len(paths) < 2:
+        return [_safe_read(path) for path in paths]
+    
+    with ThreadPoolExecutor(max_workers=min(IO_WORKERS, len(paths))) as ex:
+        return list(ex.map(_safe_read, paths))
+
+
+def find_all_grains(cartridges_dir: str = "./cartridges") -> Dict[str, List[Tuple[str, int]]]:
+    """
+    Find all grain files across all cartridges.
+    
+    Returns:
+        Dict mapping cartridge name -> sorted list of (grain_path, size_bytes).
+        Sizes come from the directory scan, so callers need no extra stat().
+    """
     grains = {}
     
-    for cartridge_dir in Path(cartridges_dir).glob("*.kbc"):
-        grains_dir = cartridge_dir / "grains"
-        if grains_dir.exists():
-            grain_files = list(grains_dir.glob("*.json"))
-            if grain_files:
-                cart_name = cartridge_dir.name.replace('.kbc', '')
-                grains[cart_name] = [str(f) for f in sorted(grain_files)]
+    try:
+        cartridge_entries = list(os.scandir(cartridges_dir))
+    except FileNotFoundError:
+        return grains
+    
+    for cart_entry in cartridge_entries:
+        if not cart_entry.name.endswith(".kbc") or not cart_entry.is_dir():
+            continue
+        
+        try:
+            grain_entries = list(os.scandir(os.path.join(cart_entry.path, "grains")))
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        
+        grain_files = [
+            (entry.path, entry.stat().st_size)
+            for entry in grain_entries
+            if entry.name.endswith(".json") and entry.is_file()
+        ]
+        if grain_files:
+            cart_name = cart_entry.name.replace('.kbc', '')
+            grains[cart_name] = sorted(grain_files)
     
     return grains
 
 
+# ============================================================================
+# SIDECAR INDEX
+# ============================================================================
+
+GRAIN_INDEX_FILENAME = ".grain_index.db"
+
+
+def build_or_refresh_index(cartridges_dir: str = "./cartridges") -> Optional[sqlite3.Connection]:
+    """
+    Open the grain metadata index, re-reading only new or modified files.
+    
+    The index lives in {cartridges_dir}/.grain_index.db and stores one row
+    per grain file (cartridge, grain_id, fact_id, confidence, size,
+    mtime_ns, and the read error for unreadable files). Files whose size and nanosecond mtime are both unchanged
+    are never reopened; deleted files are dropped from the index.
+    
+    Returns:
+        Open connection, or None if cartridges_dir does not exist. The
+        connection is closed if the refresh fails.
+    """
+    if not os.path.isdir(cartridges_dir):
+        return None
+    
+    conn = sqlite3.connect(os.path.join(cartridges_dir, GRAIN_INDEX_FILENAME))
+    try:
+        _refresh_index(conn, cartridges_dir)
+    except BaseException:
+        conn.close()
+        raise
+    
+    return conn
+
+
+def _refresh_index(conn: sqlite3.Connection, cartridges_dir: str) -> None:
+    """Bring the grains table in line with the grain files on disk."""
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(grains)")}
+    if columns and not {"mtime_ns", "error"} <= columns:
+        # Index written by an older version; it is only a cache, so rebuild
+        conn.execute("DROP TABLE grains")
+    
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS grains (
+            path TEXT PRIMARY KEY,
+            cartridge TEXT NOT NULL,
+            grain_id TEXT,
+            fact_id INTEGER,
+            confidence REAL,
+            size INTEGER NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            error TEXT
+        )
+    """)
+    
+    known = {
+        path: (size, mtime_ns)
+        for path, size, mtime_ns in conn.execute("SELECT path, size, mtime_ns FROM grains")
+    }
+    seen = set()
+    stale = []
+    
+    for cart_entry in os.scandir(cartridges_dir):
+        if not cart_entry.name.endswith(".kbc") or not cart_entry.is_dir():
+            continue
+        
+        cart_name = cart_entry.name.replace('.kbc', '')
+        try:
+            grain_entries = list(os.scandir(os.path.join(cart_entry.path, "grains")))
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        
+        for entry in grain_entries:
+            if not entry.name.endswith(".json") or not entry.is_file():
+                continue
+            
+            st = entry.stat()
+            seen.add(entry.path)
+            # Size catches a rewrite within the same mtime tick
+            if known.get(entry.path) != (st.st_size, st.st_mtime_ns):
+                stale.append((entry.path, cart_name, st))
+    
+    fields = _read_files_parallel(_read_listing_fields, [path for path, _, _ in stale])
+    changed = []
+    for (path, cart_name, st), (listing, error) in zip(stale, fields):
+        # Unreadable grains stay listed (NULL fields plus the error) so sizes add up
+        grain_id, fact_id, confidence = listing if error is None else (None, None, None)
+        changed.append((path, cart_name, grain_id, fact_id, confidence,
+                        st.st_size, st.st_mtime_ns, None if error is None else str(error)))
+    
+    conn.executemany(
+        "INSERT OR REPLACE INTO grains VALUES (?, ?, ?, ?, ?, ?, ?, ?)", changed
+    )
+    conn.executemany(
+        "DELETE FROM grains WHERE path = ?",
+        [(path,) for path in known.keys() - seen],
+    )
+    
+    # Created after the bulk insert so a cold build doesn't maintain it per row
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_grains_cartridge ON grains(cartridge)")
+    conn.commit()
+
+
+def _cartridge_size_rows(cartridges_dir: str) -> List[Tuple[str, int, int]]:
+    """Return (cartridge, grain_count, total_size) rows sorted by cartridge."""
+    try:
+        conn = build_or_refresh_index(cartridges_dir)
+    except sqlite3.Error:
+        conn = None
+    
+    if conn is None:
+        # Read-only or missing store: aggregate straight from the scan
+        grains = find_all_grains(cartridges_dir)
+        return [(cart, len(files), sum(size for _, size in files))
+                for cart, files in sorted(grains.items())]
+    
+    try:
+        return conn.execute("""
+            SELECT cartridge, COUNT(*), SUM(size) FROM grains
+            GROUP BY cartridge ORDER BY cartridge
+        """).fetchall()
+    finally:
+        conn.close()
+
+
 def print_grain_summary(cartridges_dir: str = "./cartridges"):
     """Print summary of all crystallized grains."""
-    grains = find_all_grains(cartridges_dir)
+    rows = _cartridge_size_rows(cartridges_dir)
     
-    print("\n" + "="*70)
-    print("CRYSTALLIZED GRAINS SUMMARY")
-    print("="*70)
+    lines = ["", "="*70, "CRYSTALLIZED GRAINS SUMMARY", "="*70]
     
     total_grains = 0
     total_size = 0
     
-    for cart_name in sorted(grains.keys()):
-        grain_files = grains[cart_name]
-        cart_size = 0
-        
-        for grain_file in grain_files:
-            cart_size += os.path.getsize(grain_file)
-        
-        total_grains += len(grain_files)
+    for cart_name, grain_count, cart_size in rows:
+        total_grains += grain_count
         total_size += cart_size
         
-        avg_size = cart_size / len(grain_files) if grain_files else 0
-        print(f"{cart_name:20} | {len(grain_files):3d} grains | {cart_size:>10,} bytes | {avg_size:>7.0f} bytes/grain")
+        avg_size = cart_size / grain_count if grain_count else 0
+        lines.append(f"{cart_name:20} | {grain_count:3d} grains | {cart_size:>10,} bytes | {avg_size:>7.0f} bytes/grain")
     
-    print("-"*70)
+    lines.append("-"*70)
     avg_grain = total_size / total_grains if total_grains else 0
-    print(f"{'TOTAL':20} | {total_grains:3d} grains | {total_size:>10,} bytes | {avg_grain:>7.0f} bytes/grain")
-    print("="*70 + "\n")
+    lines.append(f"{'TOTAL':20} | {total_grains:3d} grains | {total_size:>10,} bytes | {avg_grain:>7.0f} bytes/grain")
+    lines.append("="*70 + "\n")
+    
+    # One write for the whole table instead of one per row
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def inspect_grain(grain_file: str):
     """Inspect a single grain file."""
     try:
-        with open(grain_file, 'r') as f:
-            grain = json.load(f)
+        grain = _load_grain(grain_file)
         
         print(f"\nGrain: {grain.get('grain_id')}")
         print(f"File: {grain_file}")
@@ -107,32 +311,43 @@ def inspect_grain(grain_file: str):
 
 def list_grains_by_cartridge(cartridge: str, cartridges_dir: str = "./cartridges"):
     """List all grains in a specific cartridge."""
-    grains = find_all_grains(cartridges_dir)
+    try:
+        conn = build_or_refresh_index(cartridges_dir)
+    except sqlite3.Error:
+        conn = None
+    
+    if conn is not None:
+        try:
+            rows = conn.execute("""
+                SELECT path, grain_id, fact_id, confidence, size, error FROM grains
+                WHERE cartridge = ? ORDER BY path
+            """, (cartridge,)).fetchall()
+        finally:
+            conn.close()
+    else:
+        grains = find_all_grains(cartridges_dir)
+        rows = []
+        for grain_file, size in grains.get(cartridge, []):
+            try:
+                rows.append((grain_file, *_read_listing_fields(grain_file), size, None))
+            except Exception as e:
+                rows.append((grain_file, None, None, None, size, str(e)))
     
-    if cartridge not in grains:
+    if not rows:
         print(f"Cartridge '{cartridge}' not found")
         return
     
-    grain_files = grains[cartridge]
-    
-    print(f"\nGrains in '{cartridge}' ({len(grain_files)} total):")
+    print(f"\nGrains in '{cartridge}' ({len(rows)} total):")
     print("-"*70)
     print(f"{'Grain ID':<15} {'Fact ID':<10} {'Confidence':<12} {'Size':<10}")
     print("-"*70)
     
-    for grain_file in grain_files:
-        try:
-            with open(grain_file, 'r') as f:
-                grain = json.load(f)
-            
-            grain_id = grain.get('grain_id', 'unknown')
-            fact_id = grain.get('fact_id', 'unknown')
-            confidence = grain.get('confidence', 0.0)
-            size = os.path.getsize(grain_file)
-            
-            print(f"{grain_id:<15} {str(fact_id):<10} {confidence:<12.4f} {size:<10,}")
-        except Exception as e:
-            print(f"Error reading grain: {e}")
+    for grain_file, grain_id, fact_id, confidence, size, error in rows:
+        if error is not None:
+            print(f"Error reading grain: {error}")
+            continue
+        
+        print(f"{grain_id:<15} {str(fact_id):<10} {confidence:<12.4f} {size:<10,}")
     
     print()
 
@@ -182,11 +397,12 @@ def analyze_popcount_distribution(cartridges_dir: str = "./cartridges"):
 
     # Collect data
     for cartridge, grain_files in grains_data.items():
-        for grain_file in grain_files:
+        paths = [grain_file for grain_file, _ in grain_files]
+        for grain_file, (grain, error) in zip(paths, _read_files_parallel(_load_grain, paths)):
+            if error is not None:
+                print(f"Error reading {grain_file}: {error}")
+                continue
             try:
-                with open(grain_file, 'r') as f:
-                    grain = json.load(f)
-
                 grain_id = grain.get('grain_id')
                 popcount = calculate_popcount(grain)
                 quality = calculate_grain_quality(grain)
@@ -286,8 +502,6 @@ def analyze_popcount_distribution(cartridges_dir: str = "./cartridges"):
 
 def main():
     """Main menu."""
-    import sys
-    
     grains = find_all_grains()
     
     if not grains:
@@ -335,8 +549,8 @@ def main():
             print("\nAvailable grains:")
             grain_list = []
             for cart in sorted(grains.keys()):
-                for grain_file in grains[cart][:3]:  # Show first 3 per cartridge
-                    grain_id = json.load(open(grain_file)).get('grain_id', 'unknown')
+                for grain_file, _ in grains[cart][:3]:  # Show first 3 per cartridge
+                    grain_id = _read_listing_fields(grain_file)[0]
                     grain_list.append((grain_file, grain_id))
             
             for i, (grain_file, grain_id) in enumerate(grain_list[:20], 1):
@@ -359,18 +573,15 @@ def main():
                 print(f"Grain file '{grain_file}' not found")
         
         elif choice == "4":
-            print("\nCartridge Compression Comparison:")
-            print("-"*70)
-            print(f"{'Cartridge':<20} {'Grains':<8} {'Total Size':<15} {'Avg Size':<12}")
-            print("-"*70)
+            lines = ["", "Cartridge Compression Comparison:", "-"*70,
+                     f"{'Cartridge':<20} {'Grains':<8} {'Total Size':<15} {'Avg Size':<12}",
+                     "-"*70]
             
-            for cart in sorted(grains.keys()):
-                grain_files = grains[cart]
-                total_size = sum(os.path.getsize(f) for f in grain_files)
-                avg_size = total_size / len(grain_files) if grain_files else 0
-                print(f"{cart:<20} {len(grain_files):<8} {total_size:<15,} {avg_size:<12.0f}")
+            for cart, grain_count, total_size in _cartridge_size_rows("./cartridges"):
+                avg_size = total_size / grain_count if grain_count else 0
+                lines.append(f"{cart:<20} {grain_count:<8} {total_size:<15,} {avg_size:<12.0f}")
             
-            print()
+            sys.stdout.write("\n".join(lines) + "\n\n")
         
         elif choice == "5":
             analyze_popcount_distribution()
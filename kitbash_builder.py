@@ -11,30 +11,254 @@ Supports:
 
 import json
 import csv
+import fnmatch
+import hashlib
+import mmap
+import multiprocessing
+import os
 import re
+import struct
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, Iterator, List, Tuple, Optional, Any
 from kitbash_cartridge import (
     Cartridge, AnnotationMetadata, EpistemicLevel,
     Derivation
 )
 
+try:
+    import orjson
+except ImportError:  # stdlib json is used instead
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # large JSON files are loaded whole instead of streamed
+    ijson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # large CSV files are parsed with the csv module instead
+    pa = pa_csv = None
+
+
+# JSON files above this size are streamed item-by-item when ijson is available
+JSON_STREAM_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+# CSV files above this size are parsed by pyarrow when it is available
+CSV_ARROW_THRESHOLD_BYTES = 16 * 1024 * 1024
+
+# Loaders hand facts to Cartridge.add_facts in batches of this size
+FACT_BATCH_SIZE = 10_000
+
+# Markdown files above this size are scanned through mmap instead of read whole
+MARKDOWN_MMAP_THRESHOLD_BYTES = 16 * 1024 * 1024
+
+# Read size for O_DIRECT loads (a multiple of any device block size)
+DIRECT_IO_CHUNK_BYTES = 16 * 1024 * 1024
+
+
+# Distinct confidence strings remembered by _parse_confidence
+CONFIDENCE_CACHE_SIZE = 4096
+_confidence_cache: Dict[str, float] = {}
+
+
+def _parse_confidence(text: str) -> float:
+    """
+    float(text), memoized: corpora reuse a handful of values ("0.9", "0.95").
+    
+    Raises ValueError for unparseable text, exactly like float().
+    """
+    value = _confidence_cache.get(text)
+    if value is None:
+        value = float(text)
+        if len(_confidence_cache) < CONFIDENCE_CACHE_SIZE:
+            _confidence_cache[text] = value
+    return value
+
+
+def _interned(value):
+    """
+    sys.intern value if it is a str, else return it unchanged.
+    
+    Loaders pass per-row metadata (domains, sources, tags) through this so
+    thousands of annotations share one copy of each repeated string.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+def _fact_digest(content: str) -> bytes:
+    """Fixed-size (16-byte) dedup key for a fact, however long its text."""
+    return hashlib.blake2b(content.encode(), digest_size=16).digest()
+
+
+def _extend_unique(items: List, values) -> None:
+    """Append each value not already in items, in order (one set build, not a scan per value)."""
+    seen = set(items)
+    for value in values:
+        if value not in seen:
+            seen.add(value)
+            items.append(value)
+
+
+def _arrow_csv_rows(path: Path, width: int) -> Optional[Iterator[tuple]]:
+    """
+    Parse a CSV body with pyarrow's multithreaded C++ reader.
+    
+    Every column is read as a string so rows match csv.reader's output.
+    Returns None if pyarrow rejects the file (ragged rows, bad quoting),
+    leaving the caller to fall back to csv.reader.
+    """
+    names = [f"c{i}" for i in range(width)]
+    try:
+        table = pa_csv.read_csv(
+            path,
+            read_options=pa_csv.ReadOptions(column_names=names, skip_rows=1),
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={name: pa.string() for name in names}
+            ),
+        )
+    except pa.ArrowInvalid:
+        return None
+    
+    return (
+        row
+        for batch in table.to_batches(max_chunksize=FACT_BATCH_SIZE)
+        for row in zip(*(column.to_pylist() for column in batch.columns))
+    )
+
+
+def _read_text(path: Path, direct_io: bool = False) -> str:
+    """
+    Read a UTF-8 text file with universal newlines, like open(path).read().
+    
+    With direct_io, the file is read with O_DIRECT into a page-aligned
+    buffer, skipping the page-cache copy and leaving other workloads'
+    cache alone during bulk ingestion. Falls back to a normal buffered
+    read where O_DIRECT is unsupported (macOS, tmpfs, some network
+    filesystems report EINVAL).
+    """
+    if direct_io and hasattr(os, "O_DIRECT"):
+        try:
+            raw = _read_bytes_direct(path)
+        except OSError:
+            raw = None
+        if raw is not None:
+            return _normalize_newlines(raw.decode('utf-8'))
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def _normalize_newlines(text: str) -> str:
+    """Translate \\r\\n and \\r to \\n, as text-mode open() does."""
+    return text.replace('\r\n', '\n').replace('\r', '\n')
+
+
+def _read_bytes_direct(path: Path) -> bytes:
+    """Read a whole file with O_DIRECT in DIRECT_IO_CHUNK_BYTES reads."""
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECT)
+    try:
+        # Anonymous mmaps are page-aligned, which O_DIRECT requires
+        with mmap.mmap(-1, DIRECT_IO_CHUNK_BYTES) as buf:
+            chunks = []
+            while True:
+                n = os.readv(fd, [buf])
+                chunks.append(buf[:n])
+                if n < DIRECT_IO_CHUNK_BYTES:
+                    return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+# Splits "content | source | confidence | temporal_bounds" and trims each field
+FACT_FIELD_SPLIT_RE = re.compile(r'\s*\|\s*')
+
+# Sentence bodies between runs of terminal punctuation
+SENTENCE_RE = re.compile(r'[^.!?]+')
+
+
+@lru_cache(maxsize=None)
+def _markdown_line_re(domain_pattern: str, subdomain_pattern: str,
+                      fact_pattern: str, binary: bool = False) -> "re.Pattern":
+    """
+    Compile one multiline regex matching domain, subdomain and fact lines.
+    
+    Each alternative is "<marker> <text>" at the start of a line, with text
+    containing at least one non-space character; the named group that
+    matched (domain / subdomain / fact) tells the lines apart. Alternatives
+    are tried in that order, mirroring the old startswith() checks.
+    With binary, the pattern is compiled for UTF-8 bytes (mmap scans).
+    """
+    pattern = (
+        rf'^(?:{re.escape(domain_pattern)} (?P<domain>.*\S)'
+        rf'|{re.escape(subdomain_pattern)} (?P<subdomain>.*\S)'
+        rf'|{re.escape(fact_pattern)} (?P<fact>.*\S))[^\S\n]*$'
+    )
+    return re.compile(pattern.encode('utf-8') if binary else pattern, re.M)
+
+
+def _markdown_lines(line_re: "re.Pattern", text: str) -> Iterator[Tuple[str, str]]:
+    """Yield (kind, text) for each domain/subdomain/fact line of markdown text."""
+    for match in line_re.finditer(text):
+        kind = match.lastgroup
+        yield kind, match.group(kind).strip()
+
+
+def _markdown_lines_mapped(line_re: "re.Pattern", mm: mmap.mmap,
+                           start: int) -> Iterator[Tuple[str, str]]:
+    """
+    Yield (kind, text) for the marker lines of mm[start:], like _markdown_lines.
+    
+    The bytes regex runs over the mapping in place; only matched lines are
+    copied out and decoded, so prose and blank lines allocate nothing.
+    """
+    end = start
+    if start and mm[start - 1] != 0x0A:
+        # start is mid-line (text after a closing '---'); it still counts
+        # as a line start, which finditer(mm, start) would not honour
+        end = mm.find(b'\n', start)
+        if end == -1:
+            end = len(mm)
+        matches = line_re.finditer(mm[start:end])
+    else:
+        matches = iter(())
+    
+    for match in chain(matches, line_re.finditer(mm, end)):
+        kind = match.lastgroup
+        text = match.group(kind).decode('utf-8').strip()
+        if text:  # bytes \S also matches non-ASCII spaces that str.strip() drops
+            yield kind, text
+
 
 class CartridgeBuilder:
     """Build and populate cartridges from various data sources."""
     
-    def __init__(self, cartridge_name: str, cartridge_path: str = "./cartridges"):
+    def __init__(self, cartridge_name: str, cartridge_path: str = "./cartridges",
+                 dedup: bool = True):
         """
         Initialize builder (doesn't create cartridge yet).
         
         Args:
             cartridge_name: Name for the cartridge
             cartridge_path: Parent directory for cartridge files
+            dedup: Drop facts whose exact content this builder already loaded
+                before they reach the cartridge (which would discard them
+                anyway after hashing). Keeps a 16-byte digest per distinct
+                fact (about 100 bytes with set overhead), not the fact text.
         """
         self.cartridge_name = cartridge_name
         self.cartridge_path = cartridge_path
         self.cart = Cartridge(cartridge_name, cartridge_path)
         self.fact_count = 0
+        self.dedup = dedup
+        self._seen_facts = set()
     
     def build(self) -> Cartridge:
         """Create the cartridge and return it."""
@@ -52,6 +276,44 @@ class CartridgeBuilder:
         self.cart.load()
         return self.cart
 
+    @contextmanager
+    def _batched_facts(self):
+        """
+        Yield an add_fact(content, annotation) callable that buffers facts
+        and writes them with Cartridge.add_facts (one transaction per
+        FACT_BATCH_SIZE facts). Whatever is buffered is flushed on exit,
+        including when the loader raises part-way through a file.
+        """
+        pending = []
+        seen = self._seen_facts if self.dedup else None
+        
+        def flush():
+            if pending:
+                try:
+                    self.cart.add_facts(pending)
+                except Exception:
+                    if seen is not None:
+                        seen.difference_update(_fact_digest(content) for content, _ in pending)
+                    raise
+                self.fact_count += len(pending)
+                pending.clear()
+        
+        def add_fact(content: str, annotation: AnnotationMetadata) -> None:
+            if seen is not None:
+                digest = _fact_digest(content)
+                if digest in seen:
+                    self.fact_count += 1  # counted as loaded, like a cartridge-side duplicate
+                    return
+                seen.add(digest)
+            pending.append((content, annotation))
+            if len(pending) >= FACT_BATCH_SIZE:
+                flush()
+        
+        try:
+            yield add_fact
+        finally:
+            flush()
+
     def _parse_yaml_frontmatter(self, text: str) -> Tuple[dict, str]:
         """
         Extract YAML frontmatter from markdown.
@@ -237,7 +499,8 @@ class CartridgeBuilder:
     def from_markdown(self, filepath: str, 
                  domain_pattern: str = "#",
                  subdomain_pattern: str = "##",
-                 fact_pattern: str = "-") -> None:
+                 fact_pattern: str = "-",
+                 direct_io: bool = False) -> None:
         """
         Load facts from markdown file with optional YAML frontmatter.
         
@@ -252,81 +515,120 @@ class CartridgeBuilder:
         # Domain
         ## Subdomain
         - Fact text | source | confidence | temporal_bounds
+        
+        Set direct_io to read with O_DIRECT (bypasses the page cache; see
+        _read_text). Files over MARKDOWN_MMAP_THRESHOLD_BYTES are otherwise
+        scanned through mmap without decoding the whole file.
         """
         path = Path(filepath)
         if not path.exists():
             raise FileNotFoundError(f"File not found: {filepath}")
         
-        with open(path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        if not direct_io and path.stat().st_size >= MARKDOWN_MMAP_THRESHOLD_BYTES:
+            with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Bare '\r' line endings need universal-newline translation
+                if mm.find(b'\r') == -1:
+                    self._load_markdown_mapped(mm, filepath, domain_pattern,
+                                               subdomain_pattern, fact_pattern)
+                    return
         
-        # STEP 1: Parse YAML frontmatter
+        content = _read_text(path, direct_io)
+        self._load_markdown(content, filepath, domain_pattern, subdomain_pattern, fact_pattern)
+    
+    def _load_markdown(self, content: str, filepath: str,
+                       domain_pattern: str = "#",
+                       subdomain_pattern: str = "##",
+                       fact_pattern: str = "-") -> None:
+        """Parse already-read markdown (see from_markdown)."""
         frontmatter, markdown_content = self._parse_yaml_frontmatter(content)
+        line_re = _markdown_line_re(domain_pattern, subdomain_pattern, fact_pattern)
+        self._add_markdown_facts(frontmatter, _markdown_lines(line_re, markdown_content), filepath)
+    
+    def _load_markdown_mapped(self, mm: mmap.mmap, filepath: str,
+                              domain_pattern: str = "#",
+                              subdomain_pattern: str = "##",
+                              fact_pattern: str = "-") -> None:
+        """Parse memory-mapped UTF-8 markdown (see from_markdown)."""
+        # Only the frontmatter block is decoded up front
+        frontmatter, body_start = {}, 0
+        if re.match(rb'\s*---', mm):
+            opening = mm.find(b'---')
+            closing = mm.find(b'---', opening + 3)
+            if closing != -1:
+                body_start = closing + 3
+                frontmatter, _ = self._parse_yaml_frontmatter(mm[:body_start].decode('utf-8'))
         
-        # STEP 2: Apply frontmatter to cartridge
+        line_re = _markdown_line_re(domain_pattern, subdomain_pattern, fact_pattern, binary=True)
+        lines = _markdown_lines_mapped(line_re, mm, body_start)
+        try:
+            self._add_markdown_facts(frontmatter, lines, filepath)
+        finally:
+            # A suspended scan holds a buffer export that would block mm.close()
+            lines.close()
+    
+    def _add_markdown_facts(self, frontmatter: dict,
+                            lines: Iterator[Tuple[str, str]], filepath: str) -> None:
+        """Apply frontmatter, then add facts from (kind, text) markdown lines."""
         if frontmatter:
             self._apply_frontmatter(frontmatter)
         
-        # STEP 3: Parse markdown facts
-        lines = markdown_content.split('\n')
         current_domain = ""
-        current_subdomains = []
+        current_subdomain = ""
         baseline_confidence = frontmatter.get('baseline_confidence', 0.8)
+        default_domain = frontmatter.get('domain', 'general')
         
-        for line in lines:
-            line = line.rstrip()
-            
-            # Check for domain heading
-            if line.startswith(domain_pattern + " "):
-                current_domain = line.lstrip(domain_pattern).strip()
-                current_subdomains = []
-                if self.cart.manifest:
-                    if current_domain not in self.cart.manifest.get("domains", []):
+        # Get epistemic level from frontmatter or default
+        epistemic_level_str = frontmatter.get('epistemic_level', 'L2_AXIOMATIC')
+        try:
+            epistemic_level = EpistemicLevel[epistemic_level_str]
+        except KeyError:
+            epistemic_level = EpistemicLevel.L2_AXIOMATIC
+        
+        # Set mirror of manifest["domains"] for O(1) membership checks
+        known_domains = set(self.cart.manifest.get("domains", [])) if self.cart.manifest else set()
+        
+        with self._batched_facts() as add_fact:
+            for kind, text in lines:
+                # Domain heading
+                if kind == 'domain':
+                    current_domain = text
+                    current_subdomain = ""
+                    if self.cart.manifest and current_domain not in known_domains:
+                        known_domains.add(current_domain)
                         self.cart.manifest.setdefault("domains", []).append(current_domain)
-                continue
-            
-            # Check for subdomain heading
-            if line.startswith(subdomain_pattern + " "):
-                subdomain = line.lstrip(subdomain_pattern).strip()
-                if subdomain not in current_subdomains:
-                    current_subdomains.append(subdomain)
-                continue
-            
-            # Check for fact
-            if line.startswith(fact_pattern + " "):
-                fact_text = line.lstrip(fact_pattern).strip()
-                
-                # Parse: "content | source | confidence | temporal_bounds"
-                parts = [p.strip() for p in fact_text.split("|")]
-                fact_content = parts[0]
-                source = parts[1] if len(parts) > 1 else "markdown"
-                confidence = float(parts[2]) if len(parts) > 2 else baseline_confidence
-                temporal_bounds = parts[3] if len(parts) > 3 else None
+                    continue
                 
-                # Parse temporal bounds
-                temporal_validity = self._parse_temporal_bounds(temporal_bounds)
+                # Subdomain heading: facts are tagged with their immediate subdomain
+                if kind == 'subdomain':
+                    current_subdomain = text
+                    continue
                 
-                # Get epistemic level from frontmatter or default
-                epistemic_level_str = frontmatter.get('epistemic_level', 'L2_AXIOMATIC')
-                try:
-                    epistemic_level = EpistemicLevel[epistemic_level_str]
-                except KeyError:
-                    epistemic_level = EpistemicLevel.L2_AXIOMATIC
+                # Fact: "content | source | confidence | temporal_bounds"
+                if '|' in text:
+                    parts = FACT_FIELD_SPLIT_RE.split(text)
+                    fact_content = parts[0]
+                    source = _interned(parts[1]) if len(parts) > 1 else "markdown"
+                    confidence = _parse_confidence(parts[2]) if len(parts) > 2 else baseline_confidence
+                    temporal_validity = self._parse_temporal_bounds(parts[3] if len(parts) > 3 else None)
+                    start, end = temporal_validity['start'], temporal_validity['end']
+                else:
+                    # Bare fact (the common case): no split, all defaults
+                    fact_content, source, confidence = text, "markdown", baseline_confidence
+                    start = end = None
                 
                 # Create annotation
                 ann = AnnotationMetadata(
                     fact_id=0,
                     confidence=confidence,
                     sources=[source],
-                    context_domain=current_domain or frontmatter.get('domain', 'general'),
-                    context_subdomains=current_subdomains,
+                    context_domain=current_domain or default_domain,
+                    context_subdomains=[current_subdomain] if current_subdomain else [],
                     epistemic_level=epistemic_level,
-                    temporal_validity_start=temporal_validity['start'],
-                    temporal_validity_end=temporal_validity['end'],
+                    temporal_validity_start=start,
+                    temporal_validity_end=end,
                 )
                 
-                self.cart.add_fact(fact_content, ann)
-                self.fact_count += 1
+                add_fact(fact_content, ann)
         
         print(f"✓ Loaded {self.fact_count} facts from {filepath}")
 
@@ -363,34 +665,54 @@ class CartridgeBuilder:
             raise FileNotFoundError(f"File not found: {filepath}")
         
         with open(path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
+            reader = csv.reader(f)
+            header = next(reader, None) or []
             
-            for row in reader:
-                if not row.get(content_col):
-                    continue
-                
-                content = row[content_col].strip()
-                domain = row.get(domain_col, "").strip() or "general"
-                confidence = float(row.get(confidence_col, "0.8")) if confidence_col else 0.8
-                source = row.get(source_col, "csv").strip()
-                
-                # Collect other columns as context tags
-                context_tags = [
-                    v.strip() for k, v in row.items()
-                    if k not in [content_col, domain_col, confidence_col, source_col]
-                    and v and v.strip()
-                ]
-                
-                ann = AnnotationMetadata(
-                    fact_id=0,
-                    confidence=confidence,
-                    sources=[source],
-                    context_domain=domain,
-                    context_applies_to=context_tags,
-                )
-                
-                self.cart.add_fact(content, ann)
-                self.fact_count += 1
+            # Resolve column positions once. Duplicate headers: last one wins
+            # (same as csv.DictReader).
+            col_index = {name: i for i, name in enumerate(header)}
+            width = len(header)
+            content_idx = col_index.get(content_col)
+            domain_idx = col_index.get(domain_col)
+            confidence_idx = col_index.get(confidence_col) if confidence_col else None
+            source_idx = col_index.get(source_col) if source_col else None
+            
+            # Every other column is a context tag
+            reserved = {content_col, domain_col, confidence_col, source_col}
+            tag_idxs = [i for name, i in col_index.items() if name not in reserved]
+            
+            rows = None
+            if pa_csv is not None and width and path.stat().st_size >= CSV_ARROW_THRESHOLD_BYTES:
+                rows = _arrow_csv_rows(path, width)
+            if rows is None:
+                rows = reader
+            
+            with self._batched_facts() as add_fact:
+                for row in rows:
+                    if not row or content_idx is None:
+                        continue
+                    if len(row) < width:
+                        row += [None] * (width - len(row))
+                    
+                    if not row[content_idx]:
+                        continue
+                    
+                    content = row[content_idx].strip()
+                    domain = _interned((row[domain_idx].strip() if domain_idx is not None else "") or "general")
+                    confidence = _parse_confidence(row[confidence_idx]) if confidence_idx is not None else 0.8
+                    source = _interned(row[source_idx].strip()) if source_idx is not None else "csv"
+                    
+                    context_tags = [_interned(row[i].strip()) for i in tag_idxs if row[i] and row[i].strip()]
+                    
+                    ann = AnnotationMetadata(
+                        fact_id=0,
+                        confidence=confidence,
+                        sources=[source],
+                        context_domain=domain,
+                        context_applies_to=context_tags,
+                    )
+                    
+                    add_fact(content, ann)
         
         print(f"✓ Loaded {self.fact_count} facts from {filepath}")
     
@@ -425,42 +747,64 @@ class CartridgeBuilder:
         if not path.exists():
             raise FileNotFoundError(f"File not found: {filepath}")
         
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with self._batched_facts() as add_fact:
+            for item in self._iter_json_items(path):
+                if not isinstance(item, dict):
+                    continue
+                
+                content = item.get(content_key)
+                if not content:
+                    continue
+                
+                # Parse metadata if present
+                meta = item.get(metadata_key, {}) if metadata_key else {}
+                confidence = meta.get("confidence", 0.8)
+                domain = _interned(meta.get("domain", "general"))
+                sources = meta.get("sources", [])
+                if type(sources) is list:
+                    sources = [_interned(source) for source in sources]
+                applies_to = meta.get("applies_to", [])
+                excludes = meta.get("excludes", [])
+                
+                ann = AnnotationMetadata(
+                    fact_id=0,
+                    confidence=confidence,
+                    sources=sources if sources else ["json"],
+                    context_domain=domain,
+                    context_applies_to=applies_to,
+                    context_excludes=excludes,
+                )
+                
+                add_fact(content, ann)
+        
+        print(f"✓ Loaded {self.fact_count} facts from {filepath}")
+    
+    def _iter_json_items(self, path: Path):
+        """
+        Yield the top-level items of a JSON file (a single object yields itself).
+        
+        Large top-level arrays are streamed with ijson so memory stays flat;
+        everything else is parsed in one go, with orjson when installed.
+        """
+        if ijson is not None and path.stat().st_size > JSON_STREAM_THRESHOLD_BYTES:
+            with open(path, 'rb') as f:
+                head = f.read(4096).lstrip()
+                f.seek(0)
+                if head.startswith(b'['):
+                    yield from ijson.items(f, 'item', use_float=True)
+                    return
+        
+        if orjson is not None:
+            data = orjson.loads(path.read_bytes())
+        else:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
         
         # Handle both list and single object
         if isinstance(data, dict):
             data = [data]
         
-        for item in data:
-            if not isinstance(item, dict):
-                continue
-            
-            content = item.get(content_key)
-            if not content:
-                continue
-            
-            # Parse metadata if present
-            meta = item.get(metadata_key, {}) if metadata_key else {}
-            confidence = meta.get("confidence", 0.8)
-            domain = meta.get("domain", "general")
-            sources = meta.get("sources", [])
-            applies_to = meta.get("applies_to", [])
-            excludes = meta.get("excludes", [])
-            
-            ann = AnnotationMetadata(
-                fact_id=0,
-                confidence=confidence,
-                sources=sources if sources else ["json"],
-                context_domain=domain,
-                context_applies_to=applies_to,
-                context_excludes=excludes,
-            )
-            
-            self.cart.add_fact(content, ann)
-            self.fact_count += 1
-        
-        print(f"✓ Loaded {self.fact_count} facts from {filepath}")
+        yield from data
     
     # ========================================================================
     # PLAIN TEXT FORMAT
@@ -469,7 +813,8 @@ class CartridgeBuilder:
     def from_text(self, filepath: str,
                  domain: str = "general",
                  confidence: float = 0.7,
-                 one_fact_per_line: bool = True) -> None:
+                 one_fact_per_line: bool = True,
+                 direct_io: bool = False) -> None:
         """
         Load facts from plain text file.
         
@@ -480,31 +825,42 @@ class CartridgeBuilder:
             domain: Domain to assign all facts
             confidence: Default confidence for all facts
             one_fact_per_line: If False, split on sentence boundaries
+            direct_io: Read with O_DIRECT, bypassing the page cache
         """
         path = Path(filepath)
         if not path.exists():
             raise FileNotFoundError(f"File not found: {filepath}")
         
-        with open(path, 'r', encoding='utf-8') as f:
-            text = f.read()
-        
+        text = _read_text(path, direct_io)
+        self._load_plain_text(text, filepath, domain, confidence, one_fact_per_line)
+    
+    def _load_plain_text(self, text: str, filepath: str,
+                         domain: str = "general",
+                         confidence: float = 0.7,
+                         one_fact_per_line: bool = True) -> None:
+        """Parse already-read plain text (see from_text)."""
+        # Facts must be longer than 10 characters (skips very short lines);
+        # each candidate is stripped and length-checked once
         if one_fact_per_line:
-            lines = text.split('\n')
-            facts = [line.strip() for line in lines if line.strip()]
+            facts = [line for line in map(str.strip, text.split('\n')) if len(line) > 10]
         else:
-            # Split on sentence boundaries
-            facts = [s.strip() + "." for s in re.split(r'[.!?]+', text) if s.strip()]
+            # Split on sentence boundaries; with the "." appended, a
+            # 10-character sentence is long enough
+            facts = [
+                sentence + "."
+                for sentence in map(str.strip, SENTENCE_RE.findall(text))
+                if len(sentence) >= 10
+            ]
         
-        for fact in facts:
-            if len(fact) > 10:  # Skip very short lines
+        with self._batched_facts() as add_fact:
+            for fact in facts:
                 ann = AnnotationMetadata(
                     fact_id=0,
                     confidence=confidence,
                     sources=["text"],
                     context_domain=domain,
                 )
-                self.cart.add_fact(fact, ann)
-                self.fact_count += 1
+                add_fact(fact, ann)
         
         print(f"✓ Loaded {self.fact_count} facts from {filepath}")
     
@@ -514,39 +870,188 @@ class CartridgeBuilder:
     
     def from_directory(self, dirpath: str,
                       pattern: str = "*",
-                      auto_domain: bool = True) -> None:
+                      auto_domain: bool = True,
+                      workers: Optional[int] = 1) -> None:
         """
         Load facts from multiple files in a directory.
         Automatically detects format by extension.
         
+        Files are parsed serially unless workers > 1 (or None) is passed,
+        which parses them in forked worker processes (fork start method
+        only). Forking is unsafe in multithreaded callers, and worker
+        progress messages interleave, so parallel loading is opt-in.
+        Facts are still added in sorted file order, so fact IDs match a
+        serial load.
+        
         Args:
             dirpath: Directory path
             pattern: File pattern (default: all files)
             auto_domain: Use subdirectory names as domain (if True)
+            workers: Parser processes (default: 1 = serial; None = os.cpu_count())
         """
         dirpath = Path(dirpath)
         if not dirpath.is_dir():
             raise NotADirectoryError(f"Not a directory: {dirpath}")
         
-        files = list(dirpath.glob(pattern))
-        for filepath in sorted(files):
-            if filepath.is_file():
-                domain = filepath.parent.name if auto_domain else None
-                
+        files = _match_files(dirpath, pattern)
+        corpus = _read_corpus(dirpath)
+        jobs = [
+            (filepath, filepath.parent.name if auto_domain else None, corpus.get(filepath))
+            for filepath, is_file, _ in sorted(files)
+            if is_file and filepath.suffix in LOADER_SUFFIXES
+        ]
+        
+        # Readahead in inode order (roughly on-disk order); parsing stays in name order
+        inodes = {filepath: inode for filepath, _, inode in files}
+        _prefetch_files(sorted(
+            (filepath for filepath, _, text in jobs if text is None),
+            key=inodes.__getitem__,
+        ))
+        
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = min(workers, len(jobs))
+        
+        if workers > 1 and "fork" in multiprocessing.get_all_start_methods():
+            self._load_files_parallel(jobs, workers)
+        else:
+            for filepath, domain, text in jobs:
                 try:
-                    if filepath.suffix == '.md':
-                        self.from_markdown(str(filepath))
-                    elif filepath.suffix == '.csv':
-                        self.from_csv(str(filepath))
-                    elif filepath.suffix == '.json':
-                        self.from_json(str(filepath))
-                    elif filepath.suffix == '.txt':
-                        self.from_text(str(filepath), domain=domain or "general")
+                    self._load_file(filepath, domain, text)
                 except Exception as e:
                     print(f"⚠ Skipped {filepath}: {e}")
         
         print(f"✓ Processed {len(files)} files from {dirpath}")
     
+    def compile_corpus(self, dirpath: str, pattern: str = "*") -> Path:
+        """
+        Pack a directory's markdown and text files into one blob.
+        
+        Writes {dirpath}/corpus.mdstream, each file framed as
+        <uint32 little-endian length><utf-8 bytes>, plus a JSON index
+        (corpus.mdstream.idx) of source paths, payload offsets and each
+        source's size and mtime. from_directory then reads the blob once
+        instead of opening every file; sources whose size or mtime no
+        longer match are read from disk again.
+        
+        Returns:
+            Path of the corpus blob
+        """
+        dirpath = Path(dirpath)
+        if not dirpath.is_dir():
+            raise NotADirectoryError(f"Not a directory: {dirpath}")
+        
+        corpus_path = dirpath / CORPUS_FILENAME
+        entries = []
+        offset = 0
+        
+        with open(corpus_path, 'wb') as out:
+            for filepath in sorted(dirpath.glob(pattern)):
+                if filepath.suffix not in CORPUS_SUFFIXES or not filepath.is_file():
+                    continue
+                
+                with open(filepath, 'rb') as f:
+                    st = os.fstat(f.fileno())
+                    data = f.read()
+                if len(data) > 0xFFFFFFFF:
+                    raise ValueError(f"File too large for corpus framing: {filepath}")
+                
+                out.write(struct.pack('<I', len(data)))
+                out.write(data)
+                entries.append({
+                    'source': filepath.relative_to(dirpath).as_posix(),
+                    'offset': offset + 4,
+                    'length': len(data),
+                    'size': st.st_size,
+                    'mtime_ns': st.st_mtime_ns,
+                })
+                offset += 4 + len(data)
+        
+        with open(dirpath / CORPUS_INDEX_FILENAME, 'w') as f:
+            json.dump(entries, f, indent=2)
+        
+        print(f"✓ Compiled {len(entries)} files into {corpus_path}")
+        return corpus_path
+    
+    def _load_file(self, filepath: Path, domain: Optional[str],
+                   text: Optional[str] = None) -> None:
+        """Dispatch one file to its loader by extension (text: pre-read contents)."""
+        if filepath.suffix == '.md':
+            if text is None:
+                self.from_markdown(str(filepath))
+            else:
+                self._load_markdown(text, str(filepath))
+        elif filepath.suffix == '.csv':
+            self.from_csv(str(filepath))
+        elif filepath.suffix == '.json':
+            self.from_json(str(filepath))
+        elif filepath.suffix == '.txt':
+            if text is None:
+                self.from_text(str(filepath), domain=domain or "general")
+            else:
+                self._load_plain_text(text, str(filepath), domain=domain or "general")
+    
+    def _load_files_parallel(self, jobs: List[Tuple[Path, Optional[str], Optional[str]]],
+                             workers: int) -> None:
+        """Parse files in forked workers, then apply their results here in order."""
+        context = multiprocessing.get_context("fork")
+        
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as ex:
+            futures = [
+                ex.submit(_load_file_in_worker, filepath, domain, text)
+                for filepath, domain, text in jobs
+            ]
+            for (filepath, _, _), future in zip(jobs, futures):
+                facts, frontmatters, domains, error = future.result()
+                
+                # Same order as a serial load: frontmatter, domain headings, facts
+                for frontmatter in frontmatters:
+                    self._apply_frontmatter(frontmatter)
+                if domains and self.cart.manifest:
+                    _extend_unique(self.cart.manifest.setdefault("domains", []), domains)
+                if facts:
+                    try:
+                        self._add_parsed_facts(facts)
+                    except Exception as e:
+                        error = str(e)
+                if error:
+                    print(f"⚠ Skipped {filepath}: {error}")
+    
+    def _add_parsed_facts(self, facts: List[Tuple[str, AnnotationMetadata]]) -> None:
+        """Add a worker's facts, deduplicated and counted as _batched_facts does."""
+        fresh = self._drop_seen(facts) if self.dedup else facts
+        self.fact_count += len(facts) - len(fresh)  # duplicates count as loaded
+        try:
+            self.cart.add_facts(fresh)
+        except Exception:
+            if self.dedup:
+                self._seen_facts.difference_update(_fact_digest(content) for content, _ in fresh)
+            raise
+        self.fact_count += len(fresh)
+    
+    def _drop_seen(self, facts: List[Tuple[str, AnnotationMetadata]]) -> List[Tuple[str, AnnotationMetadata]]:
+        """Keep only facts whose content this builder hasn't loaded yet (see dedup)."""
+        seen = self._seen_facts
+        fresh = []
+        for content, annotation in facts:
+            digest = _fact_digest(content)
+            if digest not in seen:
+                seen.add(digest)
+                fresh.append((content, annotation))
+        return fresh
+    
+    @classmethod
+    def _detached(cls) -> "CartridgeBuilder":
+        """Builder whose loaders collect facts in memory (for worker processes)."""
+        builder = cls.__new__(cls)
+        builder.cartridge_name = None
+        builder.cartridge_path = None
+        builder.cart = _FactCollector()
+        builder.fact_count = 0
+        builder.dedup = False  # the parent dedups while merging, in file order
+        builder._seen_facts = set()
+        return builder
+    
     # ========================================================================
     # MANUAL OPERATIONS
     # ========================================================================
@@ -595,16 +1100,18 @@ class CartridgeBuilder:
         Returns:
             List of fact_ids
         """
-        fact_ids = []
-        for content, context_tag, confidence in facts:
-            fact_id = self.add_fact(
-                content,
-                domain=domain,
+        batch = [
+            (content, AnnotationMetadata(
+                fact_id=0,
                 confidence=confidence,
-                sources=sources,
-                context_tags=[context_tag] if context_tag else None,
-            )
-            fact_ids.append(fact_id)
+                sources=sources or ["manual"],
+                context_domain=domain,
+                context_applies_to=[context_tag] if context_tag else [],
+            ))
+            for content, context_tag, confidence in facts
+        ]
+        fact_ids = self.cart.add_facts(batch)
+        self.fact_count += len(batch)
         return fact_ids
     
     # ========================================================================
@@ -628,10 +1135,10 @@ class CartridgeBuilder:
             self.cart.manifest["description"] = description
         
         if domains:
-            self.cart.manifest["domains"] = list(set(self.cart.manifest.get("domains", []) + domains))
+            _extend_unique(self.cart.manifest.setdefault("domains", []), domains)
         
         if tags:
-            self.cart.manifest["tags"] = list(set(self.cart.manifest.get("tags", []) + tags))
+            _extend_unique(self.cart.manifest.setdefault("tags", []), tags)
         
         self.cart.manifest["author"] = author
     
@@ -648,6 +1155,128 @@ class CartridgeBuilder:
         }
 
 
+# ============================================================================
+# PARALLEL DIRECTORY LOADING
+# ============================================================================
+
+LOADER_SUFFIXES = {'.md', '.csv', '.json', '.txt'}
+
+# Packed corpus written by CartridgeBuilder.compile_corpus
+CORPUS_FILENAME = "corpus.mdstream"
+CORPUS_INDEX_FILENAME = "corpus.mdstream.idx"
+CORPUS_SUFFIXES = {'.md', '.txt'}
+
+
+def _read_corpus(dirpath: Path) -> Dict[Path, str]:
+    """
+    Load a compiled corpus for dirpath, if there is one.
+    
+    Returns:
+        source path -> file text, for sources whose size and mtime still
+        match the index (empty if no corpus exists)
+    """
+    corpus_path = dirpath / CORPUS_FILENAME
+    try:
+        with open(dirpath / CORPUS_INDEX_FILENAME) as f:
+            entries = json.load(f)
+        blob = memoryview(corpus_path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    
+    texts = {}
+    for entry in entries:
+        source = dirpath / entry['source']
+        try:
+            st = source.stat()
+            if st.st_size != entry.get('size') or st.st_mtime_ns != entry.get('mtime_ns'):
+                continue  # changed since compiling (even to an older mtime); read it from disk
+            start = entry['offset']
+            raw = bytes(blob[start:start + entry['length']])
+            texts[source] = _normalize_newlines(raw.decode('utf-8'))
+        except (OSError, UnicodeDecodeError):
+            continue
+    
+    return texts
+
+
+def _match_files(dirpath: Path, pattern: str) -> List[Tuple[Path, bool, int]]:
+    """
+    (path, is_file, inode) for each entry of dirpath matching pattern.
+    
+    Single-level patterns are matched in one os.scandir pass; its DirEntry
+    objects carry the file type and inode from the directory listing, so
+    no per-file stat is needed. Recursive or nested patterns ("**/*.md",
+    "sub/*") go through Path.glob, with inode 0.
+    """
+    if '**' in pattern or '/' in pattern or os.sep in pattern:
+        return [(path, path.is_file(), 0) for path in dirpath.glob(pattern)]
+    
+    with os.scandir(dirpath) as entries:
+        return [
+            (dirpath / entry.name, entry.is_file(), entry.inode())
+            for entry in entries
+            if fnmatch.fnmatch(entry.name, pattern)
+        ]
+
+
+def _prefetch_files(paths: List[Path]) -> None:
+    """
+    Ask the kernel to start reading every file before the loaders open them.
+    
+    POSIX_FADV_WILLNEED queues asynchronous readahead, so a cold directory
+    is read with many requests in flight instead of one file at a time.
+    No-op where posix_fadvise is unavailable (e.g. macOS, Windows).
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+class _FactCollector:
+    """Stand-in cartridge for worker processes: records facts and domain headings."""
+    
+    def __init__(self):
+        # Non-empty, so the markdown loader records every domain heading
+        self.manifest: Dict = {"domains": []}
+        self.facts: List[Tuple[str, AnnotationMetadata]] = []
+    
+    def add_facts(self, facts: List[Tuple[str, AnnotationMetadata]]) -> List[int]:
+        self.facts.extend(facts)
+        return []  # IDs are assigned when the parent adds them to the cartridge
+
+
+def _load_file_in_worker(filepath: Path, domain: Optional[str],
+                         text: Optional[str]) -> Tuple[List, List[dict], List[str], Optional[str]]:
+    """
+    Run the normal loader for one file in a worker process.
+    
+    Returns:
+        (facts, parsed frontmatter, domain headings, error message or None).
+        The parent applies frontmatter and domains to its manifest in file
+        order. Facts parsed before an error are kept, as with a serial load.
+    """
+    builder = CartridgeBuilder._detached()
+    frontmatters = []
+    builder._apply_frontmatter = frontmatters.append  # applied by the parent instead
+    error = None
+    try:
+        builder._load_file(filepath, domain, text)
+    except Exception as e:
+        error = str(e)
+    return builder.cart.facts, frontmatters, builder.cart.manifest["domains"], error
+
+
 # ============================================================================
 # EXAMPLE USAGE & PRESETS
 # ============================================================================
@@ -22,6 +22,11 @@ from dataclasses import dataclass, asdict, field
 from enum import Enum
 
 
+# IDs per "IN (...)" query; stays under SQLite's bound-variable limit
+# (999 before 3.32, 32766 after)
+SQL_IN_CHUNK_SIZE = 900
+
+
 # ============================================================================
 # ENUMS & TYPES
 # ============================================================================
@@ -89,9 +94,9 @@ class Relationship:
     description: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AnnotationMetadata:
-    """Annotation data structure per spec"""
+    """Annotation data structure per spec (slotted: one per fact, no __dict__)"""
     fact_id: int
     confidence: float = 0.5
     sources: List[str] = field(default_factory=list)
@@ -394,6 +399,54 @@ class Cartridge:
         fact_id = cursor.lastrowid
         self.db.commit()
         
+        self._index_fact(fact_id, content_hash, content, annotation)
+        return fact_id
+
+    def add_facts(self, facts: List[Tuple[str, Optional[AnnotationMetadata]]]) -> List[int]:
+        """
+        Add many facts in a single transaction. Deduplicates by content hash,
+        including duplicates within the batch.
+        
+        Args:
+            facts: (content, annotation) pairs; annotation may be None
+            
+        Returns:
+            fact_ids in input order
+        """
+        fact_ids = []
+        inserted = []
+        batch_hashes: Dict[str, int] = {}
+        cursor = self.db.cursor()
+        
+        try:
+            for content, annotation in facts:
+                content_hash = self._compute_content_hash(content)
+                fact_id = self.content_hash_index.get(content_hash)
+                if fact_id is None:
+                    fact_id = batch_hashes.get(content_hash)
+                if fact_id is None:
+                    cursor.execute(
+                        "INSERT INTO facts (content_hash, content) VALUES (?, ?)",
+                        (content_hash, content)
+                    )
+                    fact_id = cursor.lastrowid
+                    batch_hashes[content_hash] = fact_id
+                    inserted.append((fact_id, content_hash, content, annotation))
+                fact_ids.append(fact_id)
+        except Exception:
+            self.db.rollback()
+            raise
+        self.db.commit()
+        
+        # In-memory indices are only touched once the rows are committed
+        for fact_id, content_hash, content, annotation in inserted:
+            self._index_fact(fact_id, content_hash, content, annotation)
+        
+        return fact_ids
+
+    def _index_fact(self, fact_id: int, content_hash: str, content: str,
+                    annotation: Optional[AnnotationMetadata]) -> None:
+        """Register a newly inserted fact in the in-memory indices."""
         # Update indices
         self.content_hash_index[content_hash] = fact_id
         
@@ -421,8 +474,6 @@ class Cartridge:
                 if keyword not in self.keyword_index:
                     self.keyword_index[keyword] = set()
                 self.keyword_index[keyword].add(fact_id)
-        
-        return fact_id
 
     def get_fact(self, fact_id: int) -> Optional[str]:
         """
@@ -452,13 +503,18 @@ class Cartridge:
         if not fact_ids:
             return {}
         
+        fact_ids = list(fact_ids)
         cursor = self.db.cursor()
-        placeholders = ','.join('?' * len(fact_ids))
-        cursor.execute(
-            f"SELECT id, content FROM facts WHERE id IN ({placeholders})",
-            fact_ids
-        )
-        return {row[0]: row[1] for row in cursor.fetchall()}
+        facts = {}
+        for start in range(0, len(fact_ids), SQL_IN_CHUNK_SIZE):
+            chunk = fact_ids[start:start + SQL_IN_CHUNK_SIZE]
+            placeholders = ','.join('?' * len(chunk))
+            cursor.execute(
+                f"SELECT id, content FROM facts WHERE id IN ({placeholders})",
+                chunk
+            )
+            facts.update(cursor.fetchall())
+        return facts
     
     def get_all_facts(self) -> Dict[int, str]:
         """
@@ -526,14 +582,21 @@ class Cartridge:
         if not query_keywords:
             return []
         
-        # Find facts matching all keywords (intersection)
+        # Find facts matching all keywords (intersection). Smallest posting
+        # set first: the running result can only shrink, so it stays bounded
+        # by the rarest keyword and we stop as soon as it is empty.
+        postings = sorted(
+            (self.keyword_index[keyword] for keyword in query_keywords
+             if keyword in self.keyword_index),
+            key=len,
+        )
         candidates = None
-        for keyword in query_keywords:
-            if keyword in self.keyword_index:
-                if candidates is None:
-                    candidates = self.keyword_index[keyword].copy()
-                else:
-                    candidates &= self.keyword_index[keyword]
+        if postings:
+            candidates = postings[0].copy()
+            for posting in postings[1:]:
+                if not candidates:
+                    break
+                candidates &= posting
         
         if not candidates:
             # Fallback: facts matching any keyword
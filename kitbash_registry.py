@@ -10,6 +10,7 @@ The Delta Registry is the perception system for the Cartridge:
 """
 
 import json
+import math
 import time
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Set
@@ -19,6 +20,60 @@ from collections import defaultdict
 import statistics
 
 
+# Consistency normalization (shared with shannon_grain): confidence
+# variance saturates at 0.25, hit-count variance at 10
+CONFIDENCE_VARIANCE_SCALE = 4.0   # == 1 / 0.25, as a multiplier
+HIT_VARIANCE_CAP = 10.0           # divisor
+
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+def _fast_variance(values: List[float]) -> float:
+    """
+    One-pass sample variance (0.0 for fewer than two values).
+    
+    Avoids statistics.variance's Fraction-based arithmetic. Integer inputs
+    such as per-cycle hit counts are summed exactly, so the result matches
+    statistics.variance for them.
+    """
+    n = len(values)
+    if n < 2:
+        return 0.0
+    s = math.fsum(values)
+    s2 = math.fsum(x * x for x in values)
+    return max(0.0, (n * s2 - s * s) / (n * (n - 1)))
+
+
+class _ObservedHistory(list):
+    """
+    List that counts its own mutations.
+    
+    PhantomCandidate keeps confidence_history in one of these so its running
+    sums can tell when the history was edited directly (in place, or
+    replaced with a same-length list) and must be rebuilt.
+    """
+    version = 0
+
+
+def _bumps_version(name):
+    method = getattr(list, name)
+    
+    def mutator(self, *args, **kwargs):
+        self.version += 1
+        return method(self, *args, **kwargs)
+    
+    mutator.__name__ = name
+    return mutator
+
+
+for _name in ("__setitem__", "__delitem__", "__iadd__", "__imul__", "append",
+              "extend", "insert", "pop", "remove", "clear", "sort", "reverse"):
+    setattr(_ObservedHistory, _name, _bumps_version(_name))
+del _name
+
+
 # ============================================================================
 # DATA STRUCTURES
 # ============================================================================
@@ -55,6 +110,61 @@ class PhantomCandidate:
     cycle_consistency: float = 0.0
     status: str = "none"  # none, transient, persistent, locked
     
+    # Exact running sums over confidence_history, maintained by
+    # add_observation(). Values are kept as integer numerators over a
+    # shared power-of-two denominator (2**_conf_den_bits), so mean and
+    # variance round exactly like statistics.mean/variance.
+    _conf_num: int = field(default=0, init=False, repr=False, compare=False)
+    _conf_sqnum: int = field(default=0, init=False, repr=False, compare=False)
+    _conf_den_bits: int = field(default=0, init=False, repr=False, compare=False)
+    _n: int = field(default=0, init=False, repr=False, compare=False)
+    # The history object and mutation count the sums were built from
+    _stats_history: Optional[list] = field(default=None, init=False, repr=False, compare=False)
+    _stats_version: int = field(default=0, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._rebuild_stats()
+    
+    def add_observation(self, confidence: float) -> None:
+        """Append a confidence observation and update running sums."""
+        self._sync_stats()
+        self.confidence_history.append(confidence)
+        self._accumulate(confidence)
+        self._stats_version = self.confidence_history.version
+    
+    def _accumulate(self, confidence: float) -> None:
+        """Add one value to the running sums."""
+        num, den = confidence.as_integer_ratio()
+        bits = den.bit_length() - 1
+        if bits > self._conf_den_bits:
+            shift = bits - self._conf_den_bits
+            self._conf_num <<= shift
+            self._conf_sqnum <<= 2 * shift
+            self._conf_den_bits = bits
+        else:
+            num <<= self._conf_den_bits - bits
+        self._conf_num += num
+        self._conf_sqnum += num * num
+        self._n += 1
+    
+    def _rebuild_stats(self) -> None:
+        """Recompute running sums from confidence_history."""
+        history = self.confidence_history
+        if type(history) is not _ObservedHistory:
+            history = self.confidence_history = _ObservedHistory(history)
+        
+        self._conf_num = self._conf_sqnum = self._conf_den_bits = self._n = 0
+        for confidence in history:
+            self._accumulate(confidence)
+        self._stats_history = history
+        self._stats_version = history.version
+    
+    def _sync_stats(self) -> None:
+        """Rebuild running sums if confidence_history was changed directly."""
+        history = self.confidence_history
+        if history is not self._stats_history or history.version != self._stats_version:
+            self._rebuild_stats()
+    
     def to_dict(self) -> dict:
         return {
             "fact_id": self.fact_id,
@@ -71,9 +181,19 @@ class PhantomCandidate:
     
     def _avg_confidence(self) -> float:
         """Average confidence across all hits."""
-        if not self.confidence_history:
+        self._sync_stats()
+        if not self._n:
+            return 0.0
+        return self._conf_num / (self._n << self._conf_den_bits)
+    
+    def _confidence_variance(self) -> float:
+        """Sample variance of confidence_history (0.0 with < 2 hits)."""
+        self._sync_stats()
+        n = self._n
+        if n < 2:
             return 0.0
-        return statistics.mean(self.confidence_history)
+        spread = n * self._conf_sqnum - self._conf_num * self._conf_num
+        return spread / ((n * (n - 1)) << (2 * self._conf_den_bits))
     
     def _consistency_score(self) -> float:
         """
@@ -85,11 +205,10 @@ class PhantomCandidate:
             return 0.0
         
         try:
-            variance = statistics.variance(self.confidence_history)
+            variance = self._confidence_variance()
             # Normalize variance to 0-1 scale (lower variance → higher consistency)
             # Variance typically ranges 0-0.25, so clamp at 0.25
-            consistency = 1.0 - min(variance / 0.25, 1.0)
-            return max(0.0, consistency)
+            return max(0.0, 1.0 - variance * CONFIDENCE_VARIANCE_SCALE)
         except:
             return 0.0
 
@@ -184,7 +303,7 @@ class DeltaRegistry:
         
         phantom = self.phantoms[fact_id]
         phantom.hit_count += 1
-        phantom.confidence_history.append(confidence)
+        phantom.add_observation(confidence)
         phantom.last_cycle_seen = self.cycle_count
         
         # Track query pattern (normalized)
@@ -203,7 +322,7 @@ class DeltaRegistry:
         
         # Check for persistent status
         if len(phantom.confidence_history) >= self.persistence_threshold:
-            avg_conf = statistics.mean(phantom.confidence_history)
+            avg_conf = phantom._avg_confidence()
             if avg_conf >= self.confidence_threshold:
                 phantom.status = "persistent"
             else:
@@ -265,9 +384,9 @@ class DeltaRegistry:
         
         # Calculate variance in hit counts
         try:
-            hit_variance = statistics.variance(recent_history)
+            hit_variance = _fast_variance(recent_history)
             # Normalize: low variance (< 10) = good consistency
-            hit_consistency = 1.0 - min(hit_variance / 10.0, 1.0)
+            hit_consistency = max(0.0, 1.0 - hit_variance / HIT_VARIANCE_CAP)
         except:
             hit_consistency = 0.0
         
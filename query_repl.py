@@ -125,9 +125,10 @@ class QueryREPL:
                 print(f"  {'Fact ID':<8} {'Avg Conf':<12} {'Cycles':<8} {'Hit Count':<10}")
                 print("  " + "-"*50)
                 
-                # Sort by average confidence
-                for phantom in sorted(locked, key=lambda p: p._avg_confidence(), reverse=True):
-                    avg_conf = phantom._avg_confidence()
+                # Sort by average confidence (computed once per phantom)
+                ranked = sorted(((p._avg_confidence(), p) for p in locked),
+                                key=lambda pair: pair[0], reverse=True)
+                for avg_conf, phantom in ranked:
                     cycles_seen = phantom.last_cycle_seen - phantom.first_cycle_seen
                     print(f"  {phantom.fact_id:<8} {avg_conf:<12.4f} {cycles_seen:<8} {phantom.hit_count:<10}")
             else:
@@ -12,12 +12,14 @@ Components:
 import json
 import time
 import hashlib
+from array import array
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Set
+from typing import Dict, FrozenSet, List, Tuple, Optional, Set
 from dataclasses import dataclass, asdict, field
 from datetime import datetime, timezone
 from enum import Enum
 import statistics
+from kitbash_registry import CONFIDENCE_VARIANCE_SCALE, HIT_VARIANCE_CAP
 
 
 # ============================================================================
@@ -52,11 +54,12 @@ class PhantomCandidate:
     Becomes a grain candidate when locked (50+ cycles, high consistency).
     """
     phantom_id: str           # Unique identifier
-    fact_ids: Set[int]        # Which facts are queried together
+    fact_ids: FrozenSet[int]  # Which facts are queried together
     cartridge_id: str         # Source cartridge
     hit_count: int = 0        # Total hits this cycle
     hit_history: List[int] = field(default_factory=list)  # Hits per cycle
-    confidence_scores: List[float] = field(default_factory=list)
+    # Packed doubles: 8 bytes per observation instead of a boxed float each
+    confidence_scores: array = field(default_factory=lambda: array('d'))
     query_concepts: List[str] = field(default_factory=list)
     
     # Cycle tracking
@@ -71,6 +74,12 @@ class PhantomCandidate:
     status: str = "transient"  # transient, persistent, locked
     epistemic_level: EpistemicLevel = EpistemicLevel.L2_AXIOMATIC
     
+    def __post_init__(self):
+        if not isinstance(self.fact_ids, frozenset):
+            self.fact_ids = frozenset(self.fact_ids)
+        if not isinstance(self.confidence_scores, array):
+            self.confidence_scores = array('d', self.confidence_scores)
+    
     def avg_confidence(self) -> float:
         """Average confidence across all hits"""
         if not self.confidence_scores:
@@ -174,6 +183,11 @@ class GrainMetadata:
 # PHANTOM TRACKING (Extension to DeltaRegistry)
 # ============================================================================
 
+def _phantom_key_str(fact_ids: FrozenSet[int]) -> str:
+    """Stable string form of a phantom key ("3|7|12"), used for IDs and JSON."""
+    return "|".join(str(f) for f in sorted(fact_ids))
+
+
 class PhantomTracker:
     """
     Tracks persistent query patterns and detects harmonic lock.
@@ -190,8 +204,8 @@ class PhantomTracker:
         self.confidence_threshold = confidence_threshold
         self.harmonic_lock_cycles = harmonic_lock_cycles
         
-        # Phantom storage
-        self.phantoms: Dict[str, PhantomCandidate] = {}
+        # Phantom storage, keyed by the (immutable) set of co-accessed facts
+        self.phantoms: Dict[FrozenSet[int], PhantomCandidate] = {}
         self.cycle_count = 0
         
         # Stats
@@ -208,15 +222,15 @@ class PhantomTracker:
             confidence: Confidence in the match
             epistemic_level: Which epistemic level this fact belongs to
         """
-        # Create phantom key from sorted fact IDs
-        phantom_key = "|".join(str(f) for f in sorted(fact_ids))
+        # Hashing a frozenset is order-independent, so no per-hit sort/join
+        phantom_key = frozenset(fact_ids)
         
         # Create or update phantom
         if phantom_key not in self.phantoms:
-            phantom_id = hashlib.sha256(phantom_key.encode()).hexdigest()[:16]
+            phantom_id = hashlib.sha256(_phantom_key_str(phantom_key).encode()).hexdigest()[:16]
             self.phantoms[phantom_key] = PhantomCandidate(
                 phantom_id=phantom_id,
-                fact_ids=fact_ids,
+                fact_ids=phantom_key,
                 cartridge_id=self.cartridge_id,
                 first_cycle_seen=self.cycle_count,
                 epistemic_level=epistemic_level,
@@ -275,12 +289,12 @@ class PhantomTracker:
         try:
             hit_variance = statistics.variance(recent)
             # Normalize: lower variance = higher consistency
-            hit_consistency = 1.0 - min(hit_variance / 10.0, 1.0)
+            hit_consistency = max(0.0, 1.0 - hit_variance / HIT_VARIANCE_CAP)
         except:
             hit_consistency = 0.0
         
         # Calculate confidence consistency
-        confidence_consistency = 1.0 - min(statistics.variance(phantom.confidence_scores) / 0.25, 1.0) \
+        confidence_consistency = max(0.0, 1.0 - statistics.variance(phantom.confidence_scores) * CONFIDENCE_VARIANCE_SCALE) \
             if len(phantom.confidence_scores) > 1 else 0.0
         
         # Harmonic lock achieved if both are consistent
@@ -324,7 +338,7 @@ class PhantomTracker:
             "cycle_count": self.cycle_count,
             "total_hits": self.total_hits,
             "phantoms": {
-                key: phantom.to_dict()
+                _phantom_key_str(key): phantom.to_dict()
                 for key, phantom in self.phantoms.items()
             },
         }
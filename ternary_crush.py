@@ -9,12 +9,24 @@ Phase 2C Week 2 - Crystallization Core
 
 import json
 import hashlib
+from functools import lru_cache
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 from kitbash_cartridge import Cartridge
 from kitbash_registry import PhantomCandidate
 
 
+GRAIN_ID_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=GRAIN_ID_CACHE_SIZE)
+def _grain_id_for(fact_id: int, cartridge_id: str) -> str:
+    """Hash-based grain ID (sg_XXXXXXXX), cached so re-crushing is free."""
+    hash_input = f"{cartridge_id}:{fact_id}".encode()
+    hex_hash = hashlib.sha256(hash_input).hexdigest()[:8]
+    return f"sg_{hex_hash.upper()}"
+
+
 @dataclass
 class TernaryDelta:
     """Ternary relationship representation."""
@@ -109,14 +121,12 @@ class TernaryCrush:
         negative = []
         void = []
         
-        # Extract from derivations (structured)
-        for deriv in derivations:
-            if not deriv:
-                continue
-            
-            deriv_str = str(deriv).lower()
-            deriv_type = deriv.get('type', '') if isinstance(deriv, dict) else ''
-            target = deriv.get('target', '') if isinstance(deriv, dict) else ''
+        # Extract from derivations (structured). Only dict derivations carry
+        # a type/target, so filter once instead of type-checking per field.
+        structured = [d for d in derivations if d and isinstance(d, dict)]
+        for deriv in structured:
+            deriv_type = deriv.get('type', '')
+            target = deriv.get('target', '')
             
             # Classify by type
             if 'dependency' in deriv_type or 'requires' in deriv_type:
@@ -255,13 +265,7 @@ class TernaryCrush:
     
     def _generate_grain_id(self, fact_id: int, cartridge_id: str) -> str:
         """Generate deterministic grain ID from fact identity."""
-        
-        # Hash-based ID: sg_XXXXXXXX
-        hash_input = f"{cartridge_id}:{fact_id}".encode()
-        hash_obj = hashlib.sha256(hash_input)
-        hex_hash = hash_obj.hexdigest()[:8]
-        
-        return f"sg_{hex_hash.upper()}"
+        return _grain_id_for(fact_id, cartridge_id)
     
     def crush_all_phantoms(self, 
                           phantoms: Dict[int, PhantomCandidate],
@@ -0,0 +1,138 @@
+"""
+Unit tests for AxiomValidator
+Batch and threshold-only paths must decide exactly like validate_phantom
+"""
+
+import unittest
+import tempfile
+import shutil
+from kitbash_cartridge import Cartridge
+from kitbash_registry import PhantomCandidate
+from kitbash_registry import DeltaRegistry
+from axiom_validator import AxiomValidator
+from crystallization_orchestrator import CrystallizationOrchestrator
+
+
+def _boundary_phantoms() -> dict:
+    """Phantoms whose decimal mean or variance sits exactly on a threshold."""
+    histories = []
+    # Means of exactly 0.91 (RESISTANCE_MIN_CONFIDENCE)
+    for a in range(82, 101):
+        histories.append([a / 100, (182 - a) / 100])
+    for a in range(85, 98):
+        for b in range(85, 98):
+            histories.append([a / 100, b / 100, (273 - a - b) / 100])
+    # Variance of exactly 0.02 (INDEPENDENCE_MAX_VARIANCE)
+    histories += [[0.9, 1.1], [0.92, 1.12], [0.95, 1.15]]
+    # Single observations around SINGLE_OBSERVATION_MIN_CONFIDENCE
+    histories += [[0.9], [0.91], [0.92], []]
+    
+    phantoms = {}
+    for fact_id, history in enumerate(histories, 1):
+        phantom = PhantomCandidate(fact_id=fact_id, cartridge_id="test",
+                                   hit_count=len(history))
+        for confidence in history:
+            phantom.add_observation(confidence)
+        phantoms[fact_id] = phantom
+    return phantoms
+
+
+class TestBatchValidation(unittest.TestCase):
+    """Test validate_batch_vec and validate_fast against validate_phantom."""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cart = Cartridge("test", path=self.temp_dir)
+        self.cart.create()
+        self.validator = AxiomValidator(self.cart)
+        self.phantoms = _boundary_phantoms()
+        # Every fourth fact is missing, so persistence fails too
+        self.facts = {fact_id: f"fact {fact_id}"
+                      for fact_id in self.phantoms if fact_id % 4}
+    
+    def tearDown(self):
+        self.cart.close()
+        shutil.rmtree(self.temp_dir)
+    
+    def _reference(self) -> dict:
+        return {
+            fact_id: self.validator.validate_phantom(phantom, self.facts, full_report=True)
+            for fact_id, phantom in self.phantoms.items()
+        }
+    
+    def test_batch_vec_matches_validate_phantom(self):
+        """Test boundary phantoms lock and fail exactly as validate_phantom decides."""
+        expected = self._reference()
+        summary = self.validator.validate_batch_vec(self.phantoms, self.facts)
+        
+        locked = {p.fact_id for p in summary['locked_phantoms']}
+        assert locked == {f for f, r in expected.items() if r['locked']}
+        assert 0 < len(locked) < len(self.phantoms)
+        
+        for failure in summary['failures']:
+            report = failure.full_report()
+            reference = expected[failure.fact_id]
+            for key in ('persistent_check', 'resistance_check', 'independence_check',
+                        'locked', 'rule_failures', 'confidence'):
+                assert report[key] == reference[key], (failure.fact_id, key)
+    
+    def test_validate_fast_matches_validate_phantom(self):
+        """Test validate_fast returns exactly the phantoms validate_phantom locks."""
+        expected = self._reference()
+        locked = self.validator.validate_fast(self.phantoms, self.facts)
+        
+        assert [p.fact_id for p in locked] == [f for f, r in expected.items() if r['locked']]
+        assert self.validator.validation_log[len(expected):] == []
+    
+    def test_validate_fast_fetches_facts(self):
+        """Test validate_fast looks facts up in the cartridge when none are given."""
+        ids = self.cart.add_facts([(self.facts.get(f, f"gone {f}"), None) for f in self.phantoms])
+        assert ids == list(self.phantoms)
+        self.cart.db.execute("DELETE FROM facts WHERE id % 4 = 0")
+        self.cart.db.commit()
+        
+        expected = self._reference()
+        locked = self.validator.validate_fast(self.phantoms)
+        
+        assert [p.fact_id for p in locked] == [f for f, r in expected.items() if r['locked']]
+
+
+class TestOrchestratorValidation(unittest.TestCase):
+    """Test the orchestrator resolves phantom facts like Cartridge.get_fact."""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cart = Cartridge("test", path=self.temp_dir)
+        self.cart.create()
+    
+    def tearDown(self):
+        self.cart.close()
+        shutil.rmtree(self.temp_dir)
+    
+    def test_archived_fact_passes_persistence(self):
+        """Test a phantom on an archived fact still resolves, as with get_fact."""
+        active, archived = self.cart.add_facts([
+            ("Water boils at 100 degrees", None),
+            ("Ice melts at 0 degrees", None),
+        ])
+        self.cart.db.execute("UPDATE facts SET status = 'archived' WHERE id = ?", (archived,))
+        self.cart.db.commit()
+        
+        registry = DeltaRegistry("test")
+        for fact_id in (active, archived, 999):
+            phantom = PhantomCandidate(fact_id=fact_id, cartridge_id="test", hit_count=3)
+            for confidence in (0.95, 0.96, 0.95):
+                phantom.add_observation(confidence)
+            registry.phantoms[fact_id] = phantom
+        
+        orchestrator = CrystallizationOrchestrator(self.temp_dir, self.temp_dir)
+        locked, results = orchestrator._validate_phantoms(self.cart, registry)
+        
+        assert [p.fact_id for p in locked] == [active, archived]
+        assert results[archived]['persistent_check']
+        assert not results[999]['persistent_check']
+
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -65,6 +65,39 @@ class TestCartridgeBasics(unittest.TestCase):
         
         cart.close()
     
+    def test_add_facts_bulk(self):
+        """Test bulk insert dedups within the batch and against existing facts."""
+        cart = Cartridge("test", path=self.temp_dir)
+        cart.create()
+        
+        existing = cart.add_fact("Ice melts at 0°C")
+        ann = AnnotationMetadata(fact_id=0, confidence=0.9, context_applies_to=["kitchen"])
+        ids = cart.add_facts([
+            ("Water boils at 100°C", ann),
+            ("Ice melts at 0°C", None),
+            ("Water boils at 100°C", None),
+        ])
+        
+        assert ids[1] == existing
+        assert ids[0] == ids[2] != existing
+        assert cart.get_fact(ids[0]) == "Water boils at 100°C"
+        assert cart.annotations[ids[0]].confidence == 0.9
+        assert ids[0] in cart.query("kitchen")
+        
+        cart.close()
+    
+    def test_get_facts_many_ids(self):
+        """Test get_facts with more IDs than SQLite allows bound variables."""
+        cart = Cartridge("test", path=self.temp_dir)
+        cart.create()
+        
+        ids = cart.add_facts([(f"Fact number {i}", None) for i in range(50)])
+        facts = cart.get_facts(list(range(1, 300_001)))
+        
+        assert facts == {fact_id: f"Fact number {i}" for i, fact_id in enumerate(ids)}
+        
+        cart.close()
+    
     def test_save_and_load(self):
         """Test persistence across sessions."""
         cart = Cartridge("test", path=self.temp_dir)
@@ -50,6 +50,13 @@ def test_integration():
     print("PHASE 2B CARTRIDGE INTEGRATION TEST")
     print("="*70)
     
+    # Map each fact to the first cartridge holding it (looked up once per hit)
+    fact_to_cart = {}
+    for cn, cart in engine.cartridges.items():
+        for fid, content in cart.get_all_facts().items():
+            if content:
+                fact_to_cart.setdefault(fid, cn)
+    
     # Run 10 query cycles
     for cycle in range(10):
         print(f"\n--- Cycle {cycle + 1} ---")
@@ -66,12 +73,7 @@ def test_integration():
                 confidence = result.confidences[fact_id]
                 
                 # Find which cartridge this fact is from
-                cart_name = "unknown"
-                for cn, cart in engine.cartridges.items():
-                    fact = engine.get_fact(fact_id, cn)
-                    if fact:
-                        cart_name = cn
-                        break
+                cart_name = fact_to_cart.get(fact_id, "unknown")
                 
                 registry.record_hit(fact_id, cart_name, confidence)
         
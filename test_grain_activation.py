@@ -0,0 +1,76 @@
+"""
+Unit tests for batched grain lookups
+lookup_batch must return exactly what per-grain lookup() returns
+"""
+
+import random
+import unittest
+from shannon_grain import GrainMetadata
+from grain_activation import GrainActivation, Hat, HatRegistry, TernaryLookupEngine
+
+
+def _make_grains(count: int, seed: int = 7) -> list:
+    """Grains with random 256-bit arrays, plus all-zero and all-one edge cases."""
+    rng = random.Random(seed)
+    patterns = [(bytes(32), bytes(32)), (b"\xff" * 32, bytes(32)), (b"\xff" * 32, b"\xff" * 32)]
+    patterns += [(rng.randbytes(32), rng.randbytes(32)) for _ in range(count)]
+    return [
+        GrainMetadata(grain_id=f"sg_{i:08X}", source_phantom_id=str(i), cartridge_id="test",
+                      num_bits=256, bit_array_plus=plus, bit_array_minus=minus)
+        for i, (plus, minus) in enumerate(patterns)
+    ]
+
+
+def _comparable(result) -> tuple:
+    """Everything but latency, which is measured per call."""
+    return (result.grain_id, result.popcount_positive, result.popcount_negative,
+            result.ternary_value, result.confidence, result.context_hat)
+
+
+class TestLookupBatch(unittest.TestCase):
+    """Test lookup_batch against per-grain lookup()."""
+    
+    def setUp(self):
+        self.grains = _make_grains(50)
+    
+    def test_engine_batch_matches_lookup(self):
+        """Test every hat, with and without the context mask."""
+        engine = TernaryLookupEngine(HatRegistry())
+        for hat in Hat:
+            engine.hat_registry.set_current_hat(hat)
+            for apply_context in (True, False):
+                expected = [_comparable(engine.lookup(g, apply_context)) for g in self.grains]
+                batch = [_comparable(r) for r in engine.lookup_batch(self.grains, apply_context)]
+                assert batch == expected, (hat, apply_context)
+    
+    def test_engine_batch_mixed_widths(self):
+        """Test grains of differing widths take the per-grain path with the same results."""
+        engine = TernaryLookupEngine(HatRegistry())
+        grains = self.grains[:5] + [
+            GrainMetadata(grain_id="sg_SHORT", source_phantom_id="s", cartridge_id="test",
+                          num_bits=64, bit_array_plus=b"\x0f" * 8, bit_array_minus=b"\x01" * 8)
+        ]
+        expected = [_comparable(engine.lookup(g, False)) for g in grains]
+        assert [_comparable(r) for r in engine.lookup_batch(grains, False)] == expected
+        assert engine.lookup_batch([]) == []
+    
+    def test_activation_batch_matches_lookup(self):
+        """Test GrainActivation.lookup_batch, including grains that are not cached."""
+        activation = GrainActivation()
+        activation.activate_grains(self.grains)
+        activation.switch_context(Hat.CREATIVE)
+        grain_ids = [g.grain_id for g in self.grains[::2]] + ["sg_MISSING"]
+        
+        expected = [activation.lookup(grain_id) for grain_id in grain_ids]
+        stats_after_single = (activation.total_lookups, activation.successful_lookups)
+        batch = activation.lookup_batch(grain_ids)
+        
+        assert batch[-1] is None and expected[-1] is None
+        assert [_comparable(r) for r in batch[:-1]] == [_comparable(r) for r in expected[:-1]]
+        assert (activation.total_lookups, activation.successful_lookups) == tuple(
+            2 * count for count in stats_after_single
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
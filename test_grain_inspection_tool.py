@@ -0,0 +1,95 @@
+"""
+Unit tests for the grain inspection sidecar index
+"""
+
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from grain_inspection_tool import build_or_refresh_index, list_grains_by_cartridge
+
+
+class TestGrainIndex(unittest.TestCase):
+    """Test build_or_refresh_index tracks grain files on disk."""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.grains_dir = Path(self.temp_dir) / "physics.kbc" / "grains"
+        self.grains_dir.mkdir(parents=True)
+    
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+    
+    def _write_grain(self, name: str, fact_id: int, confidence: float) -> Path:
+        path = self.grains_dir / name
+        path.write_text(json.dumps(
+            {"grain_id": name[:-5], "fact_id": fact_id, "confidence": confidence}
+        ))
+        return path
+    
+    def _rows(self) -> dict:
+        conn = build_or_refresh_index(self.temp_dir)
+        try:
+            return {
+                Path(path).name: (fact_id, confidence, size)
+                for path, fact_id, confidence, size in conn.execute(
+                    "SELECT path, fact_id, confidence, size FROM grains"
+                )
+            }
+        finally:
+            conn.close()
+    
+    def test_refresh_on_size_change_same_mtime(self):
+        """Test a rewrite that keeps the timestamp but changes size is re-read."""
+        path = self._write_grain("sg_A.json", 1, 0.5)
+        assert self._rows()["sg_A.json"][:2] == (1, 0.5)
+        
+        st = path.stat()
+        self._write_grain("sg_A.json", 12345, 0.75)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        
+        assert self._rows()["sg_A.json"] == (12345, 0.75, path.stat().st_size)
+    
+    def test_refresh_on_mtime_change_same_size(self):
+        """Test a same-size rewrite with a new timestamp is re-read."""
+        path = self._write_grain("sg_A.json", 1, 0.5)
+        assert self._rows()["sg_A.json"][:2] == (1, 0.5)
+        
+        self._write_grain("sg_A.json", 2, 0.6)
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        
+        assert self._rows()["sg_A.json"][:2] == (2, 0.6)
+    
+    def test_deleted_files_dropped(self):
+        """Test grain files removed from disk leave the index."""
+        self._write_grain("sg_A.json", 1, 0.5)
+        doomed = self._write_grain("sg_B.json", 2, 0.6)
+        assert set(self._rows()) == {"sg_A.json", "sg_B.json"}
+        
+        doomed.unlink()
+        assert set(self._rows()) == {"sg_A.json"}
+    
+    def test_unreadable_grain_reports_error(self):
+        """Test an unreadable grain is listed with its read error."""
+        self._write_grain("sg_A.json", 1, 0.5)
+        (self.grains_dir / "sg_BAD.json").write_bytes(b"{not json")
+        
+        out = io.StringIO()
+        with redirect_stdout(out):
+            list_grains_by_cartridge("physics", self.temp_dir)
+        lines = out.getvalue().splitlines()
+        
+        errors = [line for line in lines if line.startswith("Error reading grain: ")]
+        assert len(errors) == 1
+        assert errors[0] != "Error reading grain: "
+        assert "sg_BAD" not in errors[0]
+        assert any(line.startswith("sg_A") for line in lines)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,188 @@
+"""
+Unit tests for CartridgeBuilder loaders
+Each large-file fast path must load exactly what the plain path loads
+"""
+
+import csv
+import mmap
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+import kitbash_builder
+from kitbash_builder import CartridgeBuilder
+
+
+def _loaded_facts(builder: CartridgeBuilder) -> dict:
+    """Facts with the annotation fields the loaders fill in."""
+    return {
+        fact_id: (content, ann.confidence, ann.sources, ann.context_domain,
+                  ann.context_subdomains, ann.context_applies_to, ann.context_excludes,
+                  ann.epistemic_level, ann.temporal_validity_start, ann.temporal_validity_end)
+        for fact_id, content in builder.cart.get_all_facts().items()
+        for ann in [builder.cart.annotations[fact_id]]
+    }
+
+
+class TestLargeFilePaths(unittest.TestCase):
+    """Test threshold-gated loaders against the path small files take."""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.builds = 0
+    
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+    
+    def _write(self, name: str, text: str) -> Path:
+        path = Path(self.temp_dir) / name
+        path.write_text(text, encoding='utf-8', newline='')
+        return path
+    
+    def _load(self, method: str, path: Path, **kwargs) -> dict:
+        self.builds += 1
+        builder = CartridgeBuilder("large_test", f"{self.temp_dir}/out{self.builds}")
+        builder.build()
+        getattr(builder, method)(str(path), **kwargs)
+        facts = _loaded_facts(builder)
+        builder.cart.close()
+        return facts
+    
+    @unittest.skipIf(kitbash_builder.pa_csv is None, "pyarrow not installed")
+    def test_arrow_csv_matches_csv_reader(self):
+        """Test _arrow_csv_rows gives csv.reader's rows and the same facts."""
+        path = self._write("facts.csv", (
+            "content,domain,confidence,source,tag,extra\r\n"
+            "Water boils at 100C,physics,0.9,textbook,heat,\r\n"
+            "\"Quoted, with comma\",chemistry,0.8,\"a \"\"quoted\"\" source\",,x\r\n"
+            "\"Spans\nseveral\nlines\",biology,0.75,,cells, padded \r\n"
+            ",physics,0.5,no content,,\r\n"
+            "Ünïcödé façts survive,  ,1.0,wiki,tag,tag\r\n"
+            "Last row without newline,,0.6,,,"
+        ))
+        
+        with open(path, newline='', encoding='utf-8') as f:
+            expected = list(csv.reader(f))[1:]
+        rows = kitbash_builder._arrow_csv_rows(path, 6)
+        assert rows is not None
+        assert [list(row) for row in rows] == expected
+        
+        baseline = self._load("from_csv", path)
+        with patch.object(kitbash_builder, "CSV_ARROW_THRESHOLD_BYTES", 0), \
+             patch.object(kitbash_builder, "_arrow_csv_rows",
+                          wraps=kitbash_builder._arrow_csv_rows) as arrow_rows:
+            arrow = self._load("from_csv", path)
+        
+        assert arrow_rows.call_count == 1
+        assert len(baseline) == 5
+        assert arrow == baseline
+    
+    @unittest.skipIf(kitbash_builder.ijson is None, "ijson not installed")
+    def test_streamed_json_matches_whole_file(self):
+        """Test ijson streaming loads the same facts as a whole-file parse."""
+        path = self._write("facts.json", """  [
+            {"content": "Water boils at 100C",
+             "metadata": {"confidence": 0.95, "domain": "physics", "sources": ["textbook"]}},
+            {"content": "Ünïcödé \\u00e9scapes \\"quoted\\"", "metadata": {"confidence": 1}},
+            {"content": "Exponent confidence", "metadata": {"confidence": 9.5e-1,
+             "applies_to": ["lab"], "excludes": ["vacuum"], "sources": []}},
+            {"content": "", "metadata": {"confidence": 0.5}},
+            "not an object",
+            {"content": "No metadata at all", "extra": {"nested": [1, 2.5, null]}}
+        ]""")
+        
+        baseline = self._load("from_json", path)
+        with patch.object(kitbash_builder, "JSON_STREAM_THRESHOLD_BYTES", 0), \
+             patch.object(kitbash_builder.ijson, "items",
+                          wraps=kitbash_builder.ijson.items) as stream_items:
+            streamed = self._load("from_json", path)
+        
+        assert stream_items.call_count == 1
+        assert len(baseline) == 4
+        assert streamed == baseline
+    
+    
+    def test_mapped_markdown_matches_text(self):
+        """Test the mmap scan loads the same facts as the decoded-text path."""
+        path = self._write("facts.md", (
+            "---\n"
+            "domain: Science\n"
+            "epistemic_level: L1_NARRATIVE\n"
+            "baseline_confidence: 0.85\n"
+            "---\n"
+            "- Fact before any heading\n"
+            "# Physics\n"
+            "## Mechanics\n"
+            "- Force equals mass times acceleration | Newton | 0.99 | 1687 to future\n"
+            "-   Indented fact with trailing space   \n"
+            "Prose lines are ignored\n"
+            "### Deeper heading is not a subdomain\n"
+            "# Chémistry\n"
+            "- Ünïcödé fact | wiki\n"
+            "- Energy is conserved | textbook | 0.9 | eternal"
+        ))
+        
+        baseline = self._load("from_markdown", path)
+        with patch.object(kitbash_builder, "MARKDOWN_MMAP_THRESHOLD_BYTES", 0), \
+             patch.object(CartridgeBuilder, "_load_markdown_mapped", autospec=True,
+                          side_effect=CartridgeBuilder._load_markdown_mapped) as mapped:
+            scanned = self._load("from_markdown", path)
+        
+        assert mapped.call_count == 1
+        assert len(baseline) == 5
+        assert scanned == baseline
+    
+    
+    @unittest.skipUnless(hasattr(os, "O_DIRECT"), "O_DIRECT not available")
+    def test_direct_io_matches_buffered_read(self):
+        """Test O_DIRECT reads return the file's bytes across chunk boundaries."""
+        chunk = mmap.PAGESIZE
+        with patch.object(kitbash_builder, "DIRECT_IO_CHUNK_BYTES", chunk):
+            for size in (0, 1, chunk - 1, chunk, chunk + 1, 3 * chunk + 17):
+                path = Path(self.temp_dir) / f"raw_{size}.bin"
+                path.write_bytes(os.urandom(size))
+                try:
+                    raw = kitbash_builder._read_bytes_direct(path)
+                except OSError as e:
+                    self.skipTest(f"O_DIRECT unsupported here: {e}")
+                assert raw == path.read_bytes(), size
+            
+            path = self._write("facts.txt", "Línea uno con texto\r\nLine two\rLine three\n" * 500)
+            with open(path, 'r', encoding='utf-8') as f:
+                expected = f.read()
+            assert kitbash_builder._read_text(path, direct_io=True) == expected
+            assert self._load("from_text", path, direct_io=True) == self._load("from_text", path)
+
+
+
+class TestFromDirectory(unittest.TestCase):
+    """Test from_directory worker selection."""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        source_dir = Path(self.temp_dir) / "sources"
+        source_dir.mkdir()
+        for name in ("a.md", "b.md", "c.md"):
+            (source_dir / name).write_text(f"# Physics\n- Fact from {name}\n")
+        self.source_dir = str(source_dir)
+        self.builder = CartridgeBuilder("dir_test", f"{self.temp_dir}/out")
+        self.builder.build()
+    
+    def tearDown(self):
+        self.builder.cart.close()
+        shutil.rmtree(self.temp_dir)
+    
+    def test_serial_by_default(self):
+        """Test files are loaded in-process unless workers are requested."""
+        with patch.object(os, "cpu_count", return_value=8), \
+             patch.object(CartridgeBuilder, "_load_files_parallel") as parallel:
+            self.builder.from_directory(self.source_dir)
+        
+        parallel.assert_not_called()
+        assert self.builder.fact_count == 3
+
+
+if __name__ == "__main__":
+    unittest.main()
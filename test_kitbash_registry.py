@@ -0,0 +1,62 @@
+"""
+Unit tests for PhantomCandidate running confidence stats
+"""
+
+import statistics
+import unittest
+from kitbash_registry import PhantomCandidate
+
+
+class TestPhantomStats(unittest.TestCase):
+    """Test running mean/variance against statistics on the same history."""
+    
+    def assertStatsMatch(self, phantom):
+        history = list(phantom.confidence_history)
+        assert phantom._avg_confidence() == (statistics.mean(history) if history else 0.0)
+        assert phantom._confidence_variance() == (
+            statistics.variance(history) if len(history) > 1 else 0.0
+        )
+    
+    def test_add_observation(self):
+        """Test add_observation keeps exact running stats."""
+        phantom = PhantomCandidate(fact_id=1, cartridge_id="test")
+        self.assertStatsMatch(phantom)
+        for confidence in (0.9, 0.95, 0.1, 0.333, 1.0, 0.91):
+            phantom.add_observation(confidence)
+            self.assertStatsMatch(phantom)
+    
+    def test_constructor_history(self):
+        """Test a history passed to the constructor is summed on creation."""
+        phantom = PhantomCandidate(fact_id=1, cartridge_id="test",
+                                   confidence_history=[0.8, 0.85, 0.9])
+        self.assertStatsMatch(phantom)
+    
+    def test_rebuild_after_direct_edits(self):
+        """Test stats rebuild after any direct change to confidence_history."""
+        phantom = PhantomCandidate(fact_id=1, cartridge_id="test")
+        for confidence in (0.5, 0.6, 0.7):
+            phantom.add_observation(confidence)
+        
+        phantom.confidence_history[0] = 0.95          # in place, same length
+        self.assertStatsMatch(phantom)
+        
+        phantom.confidence_history = [0.1, 0.2, 0.3]  # replaced, same length
+        self.assertStatsMatch(phantom)
+        
+        phantom.confidence_history.append(0.4)        # plain append
+        self.assertStatsMatch(phantom)
+        
+        phantom.confidence_history[:] = [0.9, 0.9]    # slice assignment
+        self.assertStatsMatch(phantom)
+        
+        phantom.add_observation(0.8)
+        self.assertStatsMatch(phantom)
+    
+    def test_stats_fields_not_constructor_args(self):
+        """Test the running-sum fields cannot be passed to the constructor."""
+        with self.assertRaises(TypeError):
+            PhantomCandidate(fact_id=1, cartridge_id="test", _n=3)
+
+
+if __name__ == "__main__":
+    unittest.main()
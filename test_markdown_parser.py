@@ -126,6 +126,135 @@ baseline_confidence: 0.96
         shutil.rmtree("cartridges/physics_test.kbc", ignore_errors=True)
 
 
+def test_heading_markers():
+    """Test heading markers match by exact prefix and tag facts with their subdomain"""
+    markdown = """# Physics
+## Mechanics
+- Force equals mass times acceleration
+### Not a heading
+#NoSpace
+##Tight
+- Momentum is conserved
+## Energy
+- Energy is conserved
+"""
+    
+    test_file = Path("test_markers.md")
+    test_file.write_text(markdown)
+    
+    try:
+        builder = CartridgeBuilder("markers_test")
+        builder.build()
+        builder.from_markdown(str(test_file))
+        
+        assert builder.cart.manifest['domains'] == ['Physics']
+        subdomains = {
+            builder.cart.facts[fact_id]: ann.context_subdomains
+            for fact_id, ann in builder.cart.annotations.items()
+        }
+        assert subdomains == {
+            'Force equals mass times acceleration': ['Mechanics'],
+            'Momentum is conserved': ['Mechanics'],
+            'Energy is conserved': ['Energy'],
+        }
+        
+        # Facts under one heading each own their subdomain list
+        first, second = list(builder.cart.annotations.values())[:2]
+        assert first.context_subdomains is not second.context_subdomains
+        
+        print("✓ Heading markers parse by exact prefix")
+        return True
+    finally:
+        test_file.unlink(missing_ok=True)
+        import shutil
+        shutil.rmtree("cartridges/markers_test.kbc", ignore_errors=True)
+
+def test_parallel_directory_matches_serial():
+    """Test a parallel directory load gives the same cartridge as a serial one"""
+    import tempfile
+    
+    files = {
+        "a.md": """---
+author: alice
+created: 2024-01-01
+baseline_confidence: 0.9
+---
+# Physics
+## Mechanics
+- Force equals mass times acceleration | Newton | 0.99
+- Energy is conserved
+""",
+        "b.md": """---
+author: Kitbash System
+created: 2024-02-01
+---
+# Chemistry
+- Atoms form bonds
+# Physics
+- Energy is conserved
+""",
+        "c.md": """# Biology
+- Cells divide by mitosis
+""",
+        "d.txt": "Water boils at one hundred degrees\nEnergy is conserved\n",
+    }
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        source_dir = Path(tmp) / "sources"
+        source_dir.mkdir()
+        for name, text in files.items():
+            (source_dir / name).write_text(text)
+        
+        results = []
+        for workers in (1, 4):
+            builder = CartridgeBuilder("parallel_test", f"{tmp}/out{workers}")
+            builder.build()
+            builder.from_directory(str(source_dir), workers=workers)
+            manifest = dict(builder.cart.manifest)
+            manifest.pop("last_updated", None)
+            facts = {
+                fact_id: (content, ann.context_domain, ann.context_subdomains,
+                          ann.sources, ann.confidence)
+                for fact_id, content in builder.cart.get_all_facts().items()
+                for ann in [builder.cart.annotations[fact_id]]
+            }
+            results.append((manifest, facts, builder.fact_count))
+        
+        serial, parallel = results
+        assert serial[0]["author"] == "Kitbash System"
+        assert serial[0]["domains"] == ["Physics", "Chemistry", "Biology"]
+        assert parallel == serial
+    
+    print("✓ Parallel directory load matches serial")
+    return True
+
+def test_compiled_corpus_replaced_source():
+    """Test a source replaced after compiling (with an older mtime) is read from disk"""
+    import os
+    import tempfile
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        source_dir = Path(tmp) / "sources"
+        source_dir.mkdir()
+        source = source_dir / "a.md"
+        source.write_text("# Physics\n- Stale fact text\n")
+        
+        builder = CartridgeBuilder("corpus_test", f"{tmp}/out")
+        builder.build()
+        builder.compile_corpus(str(source_dir))
+        
+        # Same size, timestamp pushed back before the corpus (like cp -p or rsync -t)
+        source.write_text("# Physics\n- Fresh fact text\n")
+        old = source.stat().st_mtime_ns - 3_600 * 10**9
+        os.utime(source, ns=(old, old))
+        
+        builder.from_directory(str(source_dir), workers=1)
+        assert list(builder.cart.get_all_facts().values()) == ["Fresh fact text"]
+    
+    print("✓ Replaced corpus sources are read from disk")
+    return True
+
+
 if __name__ == "__main__":
     print("Testing Enhanced Markdown Parser\n")
     
@@ -133,6 +262,9 @@ if __name__ == "__main__":
     all_pass &= test_yaml_frontmatter()
     all_pass &= test_temporal_bounds()
     all_pass &= test_full_roundtrip()
+    all_pass &= test_heading_markers()
+    all_pass &= test_parallel_directory_matches_serial()
+    all_pass &= test_compiled_corpus_replaced_source()
     
     print("\n" + "="*70)
     if all_pass: